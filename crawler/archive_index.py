@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from .config import ARCHIVE_FILENAME_FORMAT, ARCHIVE_INDEX_PATH
+from .processor.rollup import day_partial
+from .utils import epoch_us, parse_datetime
+
+
+# Daily archive JSON files stay the source of truth; their cards are mirrored
+# into a SQLite index with a (tab, published_us) index so weekly/monthly (or
+# longer) windows are range queries returning pre-parsed datetimes. A file is
+# re-read only when its mtime/size changed, and re-parsed only when its content
+# digest changed too (fresh checkouts touch every mtime). Each indexed file also
+# stores its rollup partial (processor/rollup.py) for weekly/monthly payloads.
+
+# Bump when the stored layout or the partial format changes; the index is rebuilt.
+SCHEMA_VERSION = 2
+
+CARD_COLUMNS = ("title", "url", "source", "summary", "why", "topics", "status", "hash", "importance", "card_tab")
+
+
+_conn = None
+
+
+def _connect():
+    global _conn
+    if _conn is not None:
+        return _conn
+    ARCHIVE_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(ARCHIVE_INDEX_PATH), isolation_level=None)
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != SCHEMA_VERSION:
+        for table in ("files", "cards", "day_rollups"):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS files ("
+        "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT NOT NULL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS cards ("
+        "path TEXT NOT NULL, position INTEGER NOT NULL, tab TEXT NOT NULL, day TEXT NOT NULL, "
+        "published_us INTEGER NOT NULL, title TEXT, url TEXT, source TEXT, summary TEXT, why TEXT, "
+        "topics TEXT, status TEXT, hash TEXT, importance, card_tab TEXT, "
+        "PRIMARY KEY (path, position))"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS cards_tab_published ON cards (tab, published_us)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS day_rollups ("
+        "path TEXT PRIMARY KEY, day TEXT NOT NULL, value TEXT NOT NULL)"
+    )
+    _conn = conn
+    return conn
+
+
+def _iter_days(start, end):
+    current = start.date()
+    while current <= end.date():
+        yield current.strftime("%Y-%m-%d")
+        current += timedelta(days=1)
+
+
+def daily_archive_path(archive_dir, tab, date_str):
+    year, month, _ = date_str.split("-")
+    return os.path.join(
+        archive_dir, tab, year, month, ARCHIVE_FILENAME_FORMAT.format(date=date_str, period="daily")
+    )
+
+
+def _card_rows(path, tab, day, payload, timezone):
+    rows = []
+    for position, card in enumerate(payload.get("cards", [])):
+        published_at = parse_datetime(card.get("publishedAt"), timezone)
+        if not published_at:
+            continue
+        rows.append(
+            (
+                path,
+                position,
+                tab,
+                day,
+                epoch_us(published_at),
+                card.get("title"),
+                card.get("url"),
+                card.get("source"),
+                json.dumps(card.get("summary", []), ensure_ascii=False),
+                card.get("whyItMatters"),
+                json.dumps(card.get("topics", []), ensure_ascii=False),
+                card.get("status"),
+                card.get("hash"),
+                card.get("importanceScore"),
+                card.get("tab", "ai"),
+            )
+        )
+    return rows
+
+
+def _path_range(archive_dir, tab, days):
+    # Daily file paths sort by date, so a window of one archive directory is a
+    # single path range (several archive directories may share the index).
+    return daily_archive_path(archive_dir, tab, days[0]), daily_archive_path(archive_dir, tab, days[-1])
+
+
+def _items(rows, tz):
+    """Item dicts from (published_us, *CARD_COLUMNS) rows."""
+    # One json.loads for every summary/topics list in the batch.
+    lists = json.loads("[" + ",".join(f"{row[4]},{row[6]}" for row in rows) + "]")
+    items = []
+    for idx, (published_us, title, url, source, _, why, _, status, card_hash, importance, card_tab) in enumerate(rows):
+        seconds, micros = divmod(published_us, 1_000_000)
+        items.append(
+            {
+                "title": title,
+                "url": url,
+                "source": source,
+                "published_at": datetime.fromtimestamp(seconds, tz).replace(microsecond=micros),
+                "summary": lists[2 * idx],
+                "why": why,
+                "topics": lists[2 * idx + 1],
+                "status": status,
+                "hash": card_hash,
+                "importanceScore": importance,
+                "tab": card_tab,
+            }
+        )
+    return items
+
+
+def _sync(conn, archive_dir, tab, days, timezone):
+    known = {
+        path: (mtime_ns, size, digest)
+        for path, mtime_ns, size, digest in conn.execute(
+            "SELECT path, mtime_ns, size, digest FROM files WHERE path BETWEEN ? AND ?",
+            _path_range(archive_dir, tab, days),
+        )
+    }
+    indexed = 0
+    for day in days:
+        path = daily_archive_path(archive_dir, tab, day)
+        entry = known.get(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            if entry:
+                for table in ("cards", "day_rollups", "files"):
+                    conn.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+            continue
+        if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            continue
+        raw = Path(path).read_bytes()
+        digest = hashlib.sha1(timezone.encode("utf-8") + b"\0" + raw).hexdigest()
+        if not entry or entry[2] != digest:
+            rows = _card_rows(path, tab, day, json.loads(raw), timezone)
+            conn.execute("DELETE FROM cards WHERE path = ?", (path,))
+            conn.executemany(f"INSERT INTO cards VALUES ({', '.join('?' * 15)})", rows)
+            rollup = day_partial(_items([row[4:] for row in rows], ZoneInfo(timezone)))
+            conn.execute(
+                "INSERT OR REPLACE INTO day_rollups (path, day, value) VALUES (?, ?, ?)",
+                (path, day, json.dumps(rollup, ensure_ascii=False)),
+            )
+            indexed += 1
+        conn.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+            (path, stat.st_mtime_ns, stat.st_size, digest),
+        )
+    return indexed
+
+
+def _synced(archive_dir, tab, days, timezone):
+    conn = _connect()
+    conn.execute("BEGIN")
+    try:
+        indexed = _sync(conn, archive_dir, tab, days, timezone)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    if indexed:
+        print(f"[archive] indexed {indexed} daily file(s) for {tab}")
+    return conn
+
+
+def load_daily_items(archive_dir, tab, start, end, timezone):
+    """Cards from `tab`'s daily archive files dated start..end (calendar days)
+    that were published within [start, end], in file-date then card order.
+    """
+    days = list(_iter_days(start, end))
+    if not days:
+        return []
+    archive_dir = str(archive_dir)
+    conn = _synced(archive_dir, tab, days, timezone)
+    rows = conn.execute(
+        f"SELECT published_us, {', '.join(CARD_COLUMNS)} FROM cards "
+        "WHERE tab = ? AND published_us BETWEEN ? AND ? AND path BETWEEN ? AND ? "
+        "ORDER BY day, position",
+        (tab, epoch_us(start), epoch_us(end), *_path_range(archive_dir, tab, days)),
+    ).fetchall()
+    return _items(rows, ZoneInfo(timezone))
+
+
+def _day_loader(path, tz):
+    # Weekly and monthly rollups share the day list; read each edge day once.
+    loaded = []
+
+    def load_items():
+        if not loaded:
+            rows = _connect().execute(
+                f"SELECT published_us, {', '.join(CARD_COLUMNS)} FROM cards WHERE path = ? ORDER BY position",
+                (path,),
+            ).fetchall()
+            loaded.append(_items(rows, tz))
+        return loaded[0]
+
+    return load_items
+
+
+def load_rollup_days(archive_dir, tab, start, end, timezone):
+    """[(day, partial, load_items)] for `tab`'s daily files dated start..end,
+    for processor.rollup; load_items() returns that day's cards.
+    """
+    days = list(_iter_days(start, end))
+    if not days:
+        return []
+    tz = ZoneInfo(timezone)
+    archive_dir = str(archive_dir)
+    conn = _synced(archive_dir, tab, days, timezone)
+    rows = conn.execute(
+        "SELECT path, day, value FROM day_rollups WHERE path BETWEEN ? AND ? ORDER BY day",
+        _path_range(archive_dir, tab, days),
+    ).fetchall()
+    return [(day, json.loads(value), _day_loader(path, tz)) for path, day, value in rows]
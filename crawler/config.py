@@ -18,6 +18,58 @@ MAX_PER_SOURCE = {
   "total": MAX_TOTAL_ITEMS,
 }
 
+# Feeds are fetched concurrently; the per-host cap keeps us polite to publishers
+# that serve several feeds (e.g. mk.co.kr).
+RSS_FETCH_WORKERS = 8
+RSS_FETCH_PER_HOST = 2
+
+# Near-duplicate collapsing in dedupe_items (syndicated copies of one story).
+# Only feed articles are compared; Hugging Face model ids are short and
+# templated enough to look alike.
+NEAR_DUP_KINDS = ("rss",)
+NEAR_DUP_THRESHOLD = 0.6
+NEAR_DUP_MIN_CHARS = 40
+
+# canonical_url() (crawler/utils.py): identity key for articles before hashing.
+# Query parameters matching URL_TRACKING_PARAMS (exact names, or prefixes ending
+# in "_") are dropped everywhere. Host rules are keyed by the bare host (no
+# www./m./mobile./amp. prefix): "keep_params" whitelists the query,
+# "drop_params" removes extra parameters.
+URL_TRACKING_PARAMS = (
+    "utm_",
+    "fbclid",
+    "gclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "ref_src",
+    "amp",
+    "outputtype",
+)
+URL_HOST_RULES = {
+    "boannews.com": {"keep_params": ("idx",)},
+    "korea.kr": {"drop_params": ("call_from",)},
+    "apps.apple.com": {"drop_params": ("uo",)},
+    "news.ycombinator.com": {"keep_params": ("id",)},
+    "dart.fss.or.kr": {"keep_params": ("rcpno",)},
+}
+
+# Shared HTTP client (crawler/http/client.py): one pooled session per host.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF = 0.5
+HTTP_RETRY_JITTER = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# OpenDART list.json requests (crawler/market/dart.py) run concurrently under a
+# per-key budget; OpenDART blocks keys that burst past ~1,000 requests/minute.
+# Corp-agnostic listing slices the window because list.json without corp_code
+# only accepts ranges of up to three months.
+DART_MAX_CONCURRENCY = 4
+DART_RPM_LIMIT = 600
+DART_MARKET_SLICE_DAYS = 90
+
 OPENAI_ITEM_MODEL = "gpt-5-mini"
 OPENAI_ISSUE_MODEL = "gpt-5.1"
 OPENAI_CHECK_MODEL = "gpt-4.1-mini"
@@ -101,6 +153,39 @@ OPENAI_TEMPERATURE_ITEM = None
 OPENAI_TEMPERATURE_ISSUE = None
 OPENAI_TEMPERATURE_CHECK = None
 
+# Concurrent LLM calls are throttled to the account's rate limits; the limiter
+# also follows x-ratelimit-* response headers and backs off on 429s.
+OPENAI_MAX_CONCURRENCY = 4
+OPENAI_RPM_LIMIT = 500
+OPENAI_TPM_LIMIT = 200000
+OPENAI_EXPECTED_COMPLETION_TOKENS = 800
+OPENAI_RATE_LIMIT_RETRIES = 4
+# 5xx / connection errors are retried by call_openai itself, per caller.
+OPENAI_TRANSIENT_RETRIES = 2
+
+# Short industry items are summarized this many per request (same tab); items
+# routed to the long model are still sent one at a time.
+OPENAI_ITEM_BATCH_SIZE = 8
+
+# --llm-mode batch: how often to poll the Batch API and how long to wait before
+# cancelling and finishing the remaining requests synchronously.
+OPENAI_BATCH_POLL_SECONDS = 30
+OPENAI_BATCH_TIMEOUT_SECONDS = 3600
+
+# Shared OpenAI client connection pool (crawler/llm/client.py).
+OPENAI_MAX_CONNECTIONS = 16
+OPENAI_MAX_KEEPALIVE = 8
+OPENAI_REQUEST_TIMEOUT = 120.0
+OPENAI_CONNECT_TIMEOUT = 10.0
+# The SDK's own retries would resend 429s behind the scheduler's back, so they
+# are off for chat calls; Batch API bookkeeping calls keep a few.
+OPENAI_SDK_MAX_RETRIES = 0
+OPENAI_BATCH_MAX_RETRIES = 2
+
+LLM_CACHE_ENABLED = True
+LLM_CACHE_TTL_DAYS = 14
+LLM_CACHE_MAX_ENTRIES = 20000
+
 RSS_SOURCES = [
     {
         "name": "OpenAI Blog",
@@ -281,4 +366,24 @@ DEVELOPER_MAX_CLUSTERS = 20
 PUBLIC_LATEST_DIR = Path("public/industry")
 ARCHIVE_DIR = Path("archive")
 
+# Local, rebuildable state shared across runs (restored via actions/cache in CI).
+CACHE_DIR = Path(".cache")
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+# HTTP cache entries neither stored nor revalidated for this long are pruned.
+HTTP_CACHE_TTL_DAYS = 14
+LLM_CACHE_PATH = CACHE_DIR / "llm.sqlite3"
+SEEN_INDEX_PATH = CACHE_DIR / "seen.sqlite3"
+SEEN_INDEX_TTL_DAYS = 45
+ARCHIVE_INDEX_PATH = CACHE_DIR / "archive.sqlite3"
+# OpenDART corpCode list (~100k companies); refreshed after the TTL, and the
+# stale copy is used if the download fails.
+DART_CORP_CODE_CACHE_PATH = CACHE_DIR / "dart_corp_codes.json"
+DART_CORP_CODE_TTL_DAYS = 7
+# Securities enrichment results (crawler/market/cache_store.py), one SQLite file
+# per dataset; rows unseen for the TTL expire and the file is vacuumed once
+# this share of its pages is free.
+SECURITIES_CACHE_DIR = CACHE_DIR / "securities"
+SECURITIES_CACHE_TTL_DAYS = 180
+SECURITIES_CACHE_VACUUM_RATIO = 0.25
+
 ARCHIVE_FILENAME_FORMAT = "{date}_{period}.json"
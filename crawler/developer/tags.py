@@ -1,3 +1,4 @@
+from ..textmatch import KeywordMatcher
 from ..utils import normalize_text
 
 
@@ -67,17 +68,15 @@ TAG_ALIASES = {
 }
 
 
+TAG_MATCHER = KeywordMatcher(TAG_ALIASES)
+
+
 def _alias_match(term):
     return TAG_ALIASES.get(term)
 
 
 def _keyword_match(text):
-    matches = []
-    lowered = text.lower()
-    for keyword, tag in TAG_ALIASES.items():
-        if keyword in lowered and tag not in matches:
-            matches.append(tag)
-    return matches
+    return TAG_MATCHER.labels(text)
 
 
 def normalize_tags(tags, text=None, max_tags=2):
@@ -1,9 +1,9 @@
 from datetime import datetime
 from urllib.parse import urlparse
 
-import requests
-
 from ..config import GITHUB_API_URL
+from ..http.cache import conditional_get
+from ..http.client import http_get
 
 
 def _headers(token):
@@ -32,7 +32,7 @@ def parse_github_repo(url):
 
 def fetch_repo(owner, repo, token=None):
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}"
-    response = requests.get(url, headers=_headers(token), timeout=20)
+    response = conditional_get(url, headers=_headers(token), timeout=20)
     if response.status_code == 404:
         return None
     response.raise_for_status()
@@ -41,7 +41,7 @@ def fetch_repo(owner, repo, token=None):
 
 def fetch_latest_release(owner, repo, token=None):
     url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/releases/latest"
-    response = requests.get(url, headers=_headers(token), timeout=20)
+    response = conditional_get(url, headers=_headers(token), timeout=20)
     if response.status_code in (404, 422):
         return None
     response.raise_for_status()
@@ -59,7 +59,8 @@ def search_recent_repos(*, token=None, created_after, min_stars, per_page=30, pa
             "per_page": per_page,
             "page": page,
         }
-        response = requests.get(
+        # created_after moves daily; search results are fetched uncached.
+        response = http_get(
             f"{GITHUB_API_URL}/search/repositories",
             headers=_headers(token),
             params=params,
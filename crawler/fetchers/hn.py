@@ -1,9 +1,8 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-import requests
-
 from ..config import HN_API_URL, HN_COMMENTS_MIN, HN_POINTS_MIN, HN_WINDOW_HOURS, MAX_PER_SOURCE
+from ..http.client import http_get
 from ..utils import normalize_text
 
 
@@ -18,7 +17,8 @@ def fetch_hacker_news_trending(timezone):
         "hitsPerPage": MAX_PER_SOURCE["hn"],
     }
     try:
-        response = requests.get(HN_API_URL, params=params, timeout=20)
+        # The window start changes every run, so there is nothing to revalidate.
+        response = http_get(HN_API_URL, params=params, timeout=20)
         response.raise_for_status()
     except Exception as exc:
         print(f"HN fetch failed: {exc}")
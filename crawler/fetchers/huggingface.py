@@ -1,6 +1,5 @@
-import requests
-
 from ..config import HF_TRENDING_URL, MAX_PER_SOURCE
+from ..http.cache import conditional_get
 from ..utils import normalize_text, parse_datetime
 
 
@@ -9,7 +8,7 @@ def fetch_huggingface_trending(timezone):
         "sort": "downloads",
         "limit": MAX_PER_SOURCE["huggingface"],
     }
-    response = requests.get(HF_TRENDING_URL, params=params, timeout=20)
+    response = conditional_get(HF_TRENDING_URL, params=params, timeout=20)
     response.raise_for_status()
     models = response.json()
     items = []
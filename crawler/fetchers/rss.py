@@ -1,17 +1,41 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlparse
+
 import feedparser
-import requests
 
-from ..config import MAX_PER_SOURCE
+from ..config import MAX_PER_SOURCE, RSS_FETCH_PER_HOST, RSS_FETCH_WORKERS
+from ..http.cache import conditional_get
 from ..utils import normalize_text, parse_datetime
 
 
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+# Parsed feeds keyed by URL for the lifetime of the process, so a feed shared by
+# several tabs (or by the industry and securities pipelines) is downloaded and
+# parsed once. Subscribers only read entries and apply their own limits/filters.
+_feeds = {}
+_feeds_lock = threading.Lock()
+
+
+def _host_slot(url):
+    host = (urlparse(url).netloc or "").lower()
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = threading.BoundedSemaphore(RSS_FETCH_PER_HOST)
+            _host_slots[host] = slot
+    return slot
+
+
 def _parse_feed(source):
     url = source["url"]
 
     # feedparser can mis-decode some feeds (notably EUC-KR). Fetch bytes ourselves
     # and provide decoded text when needed.
     try:
-        response = requests.get(
+        response = conditional_get(
             url,
             timeout=20,
             headers={"User-Agent": "briefly/1.0"},
@@ -36,11 +60,58 @@ def _parse_feed(source):
         return feedparser.parse(url)
 
 
-def fetch_rss_sources(sources, timezone, max_items=None):
+def _fetch_feed(source):
+    with _host_slot(source["url"]):
+        return _parse_feed(source)
+
+
+def _shared_feed(source):
+    url = source["url"]
+    with _feeds_lock:
+        future = _feeds.get(url)
+        owner = future is None
+        if owner:
+            future = Future()
+            _feeds[url] = future
+    if owner:
+        try:
+            future.set_result(_fetch_feed(source))
+        except BaseException as exc:
+            future.set_exception(exc)
+    return future.result()
+
+
+def clear_feed_cache():
+    with _feeds_lock:
+        _feeds.clear()
+
+
+def fetch_feeds(sources, workers=None):
+    """Fetch and parse every source, returning feeds in the same order as `sources`.
+
+    Sources that share a URL are fetched once and get the same parsed feed.
+    """
+    unique = {}
+    for source in sources:
+        unique.setdefault(source["url"], source)
+    unique_sources = list(unique.values())
+
+    workers = workers if isinstance(workers, int) and workers > 0 else RSS_FETCH_WORKERS
+    if workers <= 1 or len(unique_sources) <= 1:
+        feeds = [_shared_feed(source) for source in unique_sources]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(unique_sources))) as executor:
+            feeds = list(executor.map(_shared_feed, unique_sources))
+
+    by_url = {source["url"]: feed for source, feed in zip(unique_sources, feeds)}
+    return [by_url[source["url"]] for source in sources]
+
+
+def fetch_rss_sources(sources, timezone, max_items=None, workers=None):
     items = []
     limit = max_items if isinstance(max_items, int) and max_items > 0 else MAX_PER_SOURCE["rss"]
-    for source in sources:
-        feed = _parse_feed(source)
+    feeds = fetch_feeds(sources, workers=workers)
+    for source, feed in zip(sources, feeds):
         for entry in feed.entries[:limit]:
             published = (
                 entry.get("published")
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..config import HTTP_CACHE_DIR, HTTP_CACHE_TTL_DAYS
+from .client import http_get
+
+
+# Validators (ETag / Last-Modified) and the last 200 body are stored per URL so
+# reruns can revalidate with a conditional GET and replay the body on 304.
+# Only stable URLs belong here; queries carrying a timestamp or date never
+# revalidate and should use http_get. A 304 refreshes the entry's mtime, and
+# entries idle for HTTP_CACHE_TTL_DAYS are pruned once per process.
+_write_lock = threading.Lock()
+_pruned = False
+
+
+def cache_url(url, params=None):
+    return requests.Request("GET", url, params=params).prepare().url
+
+
+def _entry_paths(full_url):
+    digest = hashlib.sha1(full_url.encode("utf-8")).hexdigest()
+    return HTTP_CACHE_DIR / f"{digest}.json", HTTP_CACHE_DIR / f"{digest}.body"
+
+
+def load_entry(full_url):
+    meta_path, body_path = _entry_paths(full_url)
+    if not meta_path.exists() or not body_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if meta.get("url") != full_url:
+        return None
+    return {**meta, "body": body_path.read_bytes()}
+
+
+def _write_atomic(path, data):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def store_entry(full_url, response):
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    meta = {
+        "url": full_url,
+        "etag": etag,
+        "lastModified": last_modified,
+        "contentType": response.headers.get("Content-Type"),
+        "encoding": response.encoding,
+        "storedAt": datetime.now(timezone.utc).isoformat(),
+    }
+    meta_path, body_path = _entry_paths(full_url)
+    with _write_lock:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+
+def _touch(full_url):
+    try:
+        os.utime(_entry_paths(full_url)[0])
+    except OSError:
+        pass
+
+
+def prune(max_age_days=HTTP_CACHE_TTL_DAYS):
+    """Delete entries whose metadata is older than max_age_days, plus orphaned
+    bodies and temp files; returns the number of entries removed."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    try:
+        paths = list(HTTP_CACHE_DIR.iterdir())
+    except FileNotFoundError:
+        return 0
+    for path in paths:
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            if path.suffix == ".json":
+                path.unlink()
+                path.with_suffix(".body").unlink(missing_ok=True)
+                removed += 1
+            elif path.suffix == ".tmp" or not path.with_suffix(".json").exists():
+                path.unlink()
+        except OSError:
+            continue
+    return removed
+
+
+def _prune_once():
+    global _pruned
+    with _write_lock:
+        if _pruned:
+            return
+        _pruned = True
+        removed = prune()
+    if removed:
+        print(f"[http] pruned {removed} cache entries idle for {HTTP_CACHE_TTL_DAYS}+ days")
+
+
+def _replay(response, entry):
+    replay = requests.Response()
+    replay.status_code = 200
+    replay.reason = "OK"
+    replay._content = entry["body"]
+    replay.headers = CaseInsensitiveDict(response.headers)
+    if entry.get("contentType"):
+        replay.headers["Content-Type"] = entry["contentType"]
+    replay.encoding = entry.get("encoding")
+    replay.url = response.url
+    replay.request = response.request
+    replay.elapsed = response.elapsed
+    replay.from_cache = True
+    return replay
+
+
+def conditional_get(url, *, params=None, headers=None, timeout=20):
+    _prune_once()
+    full_url = cache_url(url, params)
+    entry = load_entry(full_url)
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            request_headers["If-Modified-Since"] = entry["lastModified"]
+
+    response = http_get(url, params=params, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry:
+        _touch(full_url)
+        return _replay(response, entry)
+    if response.status_code == 200:
+        try:
+            store_entry(full_url, response)
+        except OSError as exc:
+            print(f"[http] cache write failed for {full_url}: {exc}")
+    return response
@@ -0,0 +1,80 @@
+import importlib.util
+import random
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_JITTER,
+    HTTP_RETRY_STATUSES,
+    HTTP_RETRY_TOTAL,
+)
+
+
+def _brotli_available():
+    return any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+
+
+# Only advertise br when urllib3 can actually decode it.
+ACCEPT_ENCODING = "gzip, br" if _brotli_available() else "gzip"
+
+
+class _JitteredRetry(Retry):
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, HTTP_RETRY_JITTER)
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _build_session():
+    retry = _JitteredRetry(
+        total=HTTP_RETRY_TOTAL,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+def session_for(url):
+    parsed = urlparse(url)
+    key = f"{parsed.scheme}://{(parsed.netloc or '').lower()}"
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _build_session()
+            _sessions[key] = session
+    return session
+
+
+def http_get(url, *, params=None, headers=None, timeout=20):
+    return session_for(url).get(url, params=params, headers=headers, timeout=timeout)
+
+
+def close_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -0,0 +1,106 @@
+import json
+import time
+from datetime import datetime
+
+from ..config import OPENAI_BATCH_MAX_RETRIES, OPENAI_BATCH_POLL_SECONDS, OPENAI_BATCH_TIMEOUT_SECONDS
+from . import stats
+from .client import get_client
+
+
+# Offline mode for scheduled runs: requests go through the OpenAI Batch API
+# (cheaper, separate rate limits) instead of synchronous chat completions.
+# Callers send anything that comes back missing or malformed through their
+# regular synchronous path.
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def build_input(requests):
+    lines = []
+    for custom_id, body in requests:
+        line = {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }
+        lines.append(json.dumps(line, ensure_ascii=False))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def parse_output(text):
+    contents = {}
+    for line in (text or "").splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            continue
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if record.get("custom_id") and content:
+            contents[record["custom_id"]] = content
+    return contents
+
+
+def wait_for_batch(client, batch_id, poll_seconds, timeout_seconds):
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_STATUSES:
+            return batch
+        if time.monotonic() >= deadline:
+            print(f"[LLM] batch {batch_id} still {batch.status} after {timeout_seconds}s, cancelling")
+            try:
+                return client.batches.cancel(batch_id)
+            except Exception as exc:
+                print(f"[LLM] batch cancel failed: {exc}")
+            return batch
+        time.sleep(poll_seconds)
+
+
+def run_batch(requests, label="batch", poll_seconds=None, timeout_seconds=None):
+    """Submit [(custom_id, chat.completions body), ...] as one batch.
+
+    Returns {custom_id: message content} for the requests that succeeded.
+    """
+    if not requests:
+        return {}
+    client = get_client()
+    if not client:
+        print("[LLM] OPENAI_API_KEY not set; skipping batch submission")
+        return {}
+    client = client.with_options(max_retries=OPENAI_BATCH_MAX_RETRIES)
+
+    poll_seconds = OPENAI_BATCH_POLL_SECONDS if poll_seconds is None else poll_seconds
+    timeout_seconds = OPENAI_BATCH_TIMEOUT_SECONDS if timeout_seconds is None else timeout_seconds
+    filename = f"{label}_{datetime.now().strftime('%Y%m%d%H%M%S')}.jsonl"
+    stats.incr("batchRequests", len(requests))
+
+    try:
+        input_file = client.files.create(file=(filename, build_input(requests)), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            metadata={"label": label},
+        )
+        print(f"[LLM] submitted batch {batch.id} ({len(requests)} requests)")
+        batch = wait_for_batch(client, batch.id, poll_seconds, timeout_seconds)
+        print(f"[LLM] batch {batch.id} finished with status {batch.status}")
+        if not batch.output_file_id:
+            return {}
+        contents = parse_output(client.files.content(batch.output_file_id).text)
+    except Exception as exc:
+        print(f"[LLM] batch submission failed: {exc}")
+        stats.incr("batchErrors")
+        return {}
+
+    stats.incr("batchSucceeded", len(contents))
+    return contents
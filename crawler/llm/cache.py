@@ -0,0 +1,110 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from ..config import LLM_CACHE_ENABLED, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH, LLM_CACHE_TTL_DAYS
+from . import stats
+
+
+# Bump a kind's version whenever its prompt template or result shape changes so
+# stale responses stop matching.
+PROMPT_VERSIONS = {
+    "item": 2,
+    "oneliners": 2,
+    "highlights": 2,
+    "issues": 2,
+}
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _connect():
+    global _conn
+    if _conn is None:
+        LLM_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(LLM_CACHE_PATH), check_same_thread=False, isolation_level=None)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, kind TEXT NOT NULL, created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created_at)")
+        _evict(conn)
+        _conn = conn
+    return _conn
+
+
+def _evict(conn):
+    cutoff = time.time() - LLM_CACHE_TTL_DAYS * 86400
+    conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+    (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+    overflow = count - LLM_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+            (overflow,),
+        )
+
+
+def cache_key(kind, model, payload):
+    raw = json.dumps(
+        [kind, PROMPT_VERSIONS.get(kind, 0), model, payload],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def lookup(kind, model, payload):
+    if not LLM_CACHE_ENABLED:
+        return None
+    key = cache_key(kind, model, payload)
+    now = time.time()
+    try:
+        with _lock:
+            conn = _connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and row[1] >= now - LLM_CACHE_TTL_DAYS * 86400:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            else:
+                row = None
+    except sqlite3.Error as exc:
+        print(f"[LLM] cache lookup failed: {exc}")
+        row = None
+    if row is None:
+        stats.incr("cacheMisses")
+        return None
+    stats.incr("cacheHits")
+    return json.loads(row[0])
+
+
+def store(kind, model, payload, value):
+    if not LLM_CACHE_ENABLED:
+        return
+    key = cache_key(kind, model, payload)
+    now = time.time()
+    try:
+        with _lock:
+            _connect().execute(
+                "INSERT OR REPLACE INTO responses (key, kind, created_at, accessed_at, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, kind, now, now, json.dumps(value, ensure_ascii=False)),
+            )
+    except sqlite3.Error as exc:
+        print(f"[LLM] cache store failed: {exc}")
+
+
+def close():
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _evict(_conn)
+            _conn.close()
+            _conn = None
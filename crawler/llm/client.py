@@ -0,0 +1,59 @@
+import os
+import threading
+
+import httpx
+from openai import DefaultHttpxClient, OpenAI
+
+from ..config import (
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_KEEPALIVE,
+    OPENAI_REQUEST_TIMEOUT,
+    OPENAI_SDK_MAX_RETRIES,
+)
+
+
+# One OpenAI client (and so one httpx connection pool) per process, shared by
+# every thread. It is rebuilt only if the key or base URL changes.
+_client = None
+_client_key = None
+_lock = threading.Lock()
+
+
+def get_client():
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    key = (api_key, os.getenv("OPENAI_BASE_URL"))
+
+    global _client, _client_key
+    client = _client
+    if client is not None and _client_key == key:
+        return client
+    with _lock:
+        if _client is None or _client_key != key:
+            if _client is not None:
+                _client.close()
+            http_client = DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=OPENAI_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENAI_MAX_KEEPALIVE,
+                ),
+                timeout=httpx.Timeout(OPENAI_REQUEST_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+            )
+            _client = OpenAI(
+                api_key=api_key,
+                http_client=http_client,
+                max_retries=OPENAI_SDK_MAX_RETRIES,
+            )
+            _client_key = key
+        return _client
+
+
+def close_client():
+    global _client, _client_key
+    with _lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _client_key = None
@@ -1,20 +1,29 @@
 import json
-import os
+import random
+import time
 
-from openai import OpenAI
+from openai import APIConnectionError, InternalServerError, RateLimitError
 
 from ..config import (
+    OPENAI_EXPECTED_COMPLETION_TOKENS,
+    OPENAI_ITEM_BATCH_SIZE,
     OPENAI_ITEM_MODEL_LONG,
     OPENAI_ITEM_MODEL_SHORT,
     OPENAI_ITEM_MODEL_THRESHOLD,
     OPENAI_ISSUE_MODEL,
     OPENAI_ITEM_MODEL,
+    OPENAI_RATE_LIMIT_RETRIES,
     OPENAI_TEMPERATURE_ISSUE,
     OPENAI_TEMPERATURE_ITEM,
+    OPENAI_TRANSIENT_RETRIES,
     TOPIC_TAXONOMY,
     TOPIC_TAXONOMY_BY_TAB,
 )
+from ..textmatch import compiled
 from ..utils import normalize_text
+from . import cache as response_cache
+from . import batch_api, scheduler, schemas, stats
+from .client import get_client
 
 
 TOPIC_KEYWORDS_AI = {
@@ -242,13 +251,15 @@ TOPIC_KEYWORDS_BY_TAB = {
 }
 
 
+def _topic_matcher(keywords):
+    # Keys are matched as written against lowercased text, so all-caps entries
+    # ("STO", "PF", ...) stay inert; lowercased they would hit inside ordinary
+    # words ("stock", "platform").
+    return compiled(keywords, case_sensitive=True)
+
+
 def map_topics_from_text(text, keywords):
-    lowered = text.lower()
-    found = []
-    for key, label in keywords.items():
-        if key in lowered and label not in found:
-            found.append(label)
-    return found
+    return _topic_matcher(keywords).labels(text.lower())
 
 
 def default_topics(text, taxonomy, keywords):
@@ -266,10 +277,7 @@ def normalize_topic(topic, taxonomy, keywords):
     for category in taxonomy:
         if category.lower() in cleaned:
             return category
-    for key, label in keywords.items():
-        if key in cleaned:
-            return label
-    return None
+    return _topic_matcher(keywords).first(cleaned)
 
 
 def normalize_topics(topics, fallback_text, taxonomy, keywords):
@@ -301,6 +309,9 @@ def fallback_summary(item, taxonomy, keywords):
         "topics": topics,
         "status": "NEW",
         "importanceScore": 5,
+        # Tells callers this is not a model or cached summary; fallbacks are
+        # never cached or carried across runs.
+        "fallback": True,
     }
 
 
@@ -339,31 +350,46 @@ def extract_json(text):
     return cleaned[start : end + 1]
 
 
-def build_client():
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return OpenAI(api_key=api_key)
-
-
-def call_openai(messages, model, temperature=None):
-    client = build_client()
+def call_openai(messages, model, temperature=None, completion_tokens=None, response_format=None):
+    client = get_client()
     if not client:
         return None, "OPENAI_API_KEY not set"
-    try:
-        params = {
-            "model": model,
-            "messages": messages,
-        }
-        if temperature is not None:
-            params["temperature"] = temperature
-        response = client.chat.completions.create(**params)
-        return response, None
-    except Exception as exc:
-        return None, str(exc)
-
-
-def summarize_item(item, model=None, tab="ai"):
+    params = {
+        "model": model,
+        "messages": messages,
+    }
+    if temperature is not None:
+        params["temperature"] = temperature
+    if response_format is not None:
+        params["response_format"] = response_format
+    rate_limited = 0
+    transient = 0
+    while True:
+        scheduler.acquire(messages, completion_tokens)
+        stats.incr("apiCalls")
+        started = time.perf_counter()
+        try:
+            raw = client.chat.completions.with_raw_response.create(**params)
+            stats.observe("latencyMs", (time.perf_counter() - started) * 1000)
+            scheduler.observe_headers(raw.headers)
+            return raw.parse(), None
+        except RateLimitError as exc:
+            stats.incr("rateLimited")
+            if rate_limited >= OPENAI_RATE_LIMIT_RETRIES:
+                return None, str(exc)
+            scheduler.backoff(exc, rate_limited)
+            rate_limited += 1
+        except (APIConnectionError, InternalServerError) as exc:
+            if transient >= OPENAI_TRANSIENT_RETRIES:
+                return None, str(exc)
+            stats.incr("transientRetries")
+            time.sleep(min(8.0, 0.5 * 2 ** transient) + random.uniform(0, 0.25))
+            transient += 1
+        except Exception as exc:
+            return None, str(exc)
+
+
+def _item_context(item, tab, model=None):
     payload = build_prompt(item)
     taxonomy = TOPIC_TAXONOMY_BY_TAB.get(tab, TOPIC_TAXONOMY)
     keywords = TOPIC_KEYWORDS_BY_TAB.get(tab, TOPIC_KEYWORDS_AI)
@@ -375,25 +401,106 @@ def summarize_item(item, model=None, tab="ai"):
             model_name = OPENAI_ITEM_MODEL_LONG
         else:
             model_name = OPENAI_ITEM_MODEL_SHORT or OPENAI_ITEM_MODEL
+    cache_payload = {"title": payload.get("title"), "snippet": payload.get("snippet"), "tab": tab}
+    return payload, taxonomy, keywords, model_name, cache_payload
+
+
+def _item_instructions(taxonomy):
     topic_list = ", ".join(taxonomy)
-    prompt = (
-        "업데이트를 요약하는 분석가입니다. "
-        "한국어로만 응답하세요. JSON만 반환하세요. "
+    return (
         "키: summary(짧은 문장 3개 배열), why(한 문장), topics(2-5개 태그), "
         "status(NEW|ONGOING|SHIFTING), importanceScore(1-10 정수). "
         "topics는 반드시 다음 목록에서만 선택하세요: "
         f"{topic_list}. "
         "importanceScore는 중요도/영향도를 반영하세요. "
+    )
+
+
+def _repair_item(element):
+    fixed = {key: element.get(key) for key in ("summary", "why", "topics", "status", "importanceScore")}
+    summary = fixed.get("summary")
+    if isinstance(summary, str):
+        summary = [line.strip() for line in summary.split("\n")]
+    if not isinstance(summary, list):
+        return None
+    fixed["summary"] = [normalize_text(str(line)) for line in summary if line]
+    if not fixed["summary"]:
+        return None
+    if not isinstance(fixed.get("why"), str):
+        fixed["why"] = ""
+    if fixed.get("status") not in schemas.ITEM_STATUSES:
+        fixed["status"] = "NEW"
+    try:
+        fixed["importanceScore"] = max(1, min(10, int(float(fixed.get("importanceScore")))))
+    except (TypeError, ValueError):
+        fixed["importanceScore"] = 5
+    # Off-list topics are mapped (or dropped) by normalize_topics afterwards.
+    fixed["topics"] = [topic for topic in fixed.get("topics") or [] if isinstance(topic, str)]
+    return fixed
+
+
+def _item_summary(result, payload, taxonomy, keywords):
+    if not isinstance(result, dict) or not isinstance(result.get("summary"), list):
+        raise ValueError("Invalid summary")
+    topics = normalize_topics(
+        result.get("topics"),
+        f"{payload.get('title', '')} {payload.get('snippet', '')}",
+        taxonomy,
+        keywords,
+    )
+    return {
+        "summary": result.get("summary")[:3],
+        "why": result.get("why") or "",
+        "topics": topics,
+        "status": result.get("status") or "NEW",
+        "importanceScore": int(result.get("importanceScore") or 5),
+    }
+
+
+def _item_messages(payload, taxonomy):
+    prompt = (
+        "업데이트를 요약하는 분석가입니다. "
+        "한국어로만 응답하세요. JSON만 반환하세요. "
+        f"{_item_instructions(taxonomy)}"
         f"Input: {json.dumps(payload, ensure_ascii=False)}"
     )
+    return [
+        {"role": "system", "content": "You output only valid JSON."},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _item_format(taxonomy):
+    return schemas.response_format("item_summary", schemas.item_schema(taxonomy))
+
+
+def _check_item(element, taxonomy):
+    # Topics outside the taxonomy are tolerated here and mapped by normalize_topics.
+    schema = schemas.item_schema(taxonomy)
+    schema["properties"]["topics"] = {"type": "array", "items": {"type": "string"}}
+    kept, _ = schemas.check_elements([element], schema, _repair_item)
+    return kept[0] if kept else None
+
+
+def _parse_item_content(content, payload, taxonomy, keywords):
+    result = _check_item(schemas.load_reply(content, extract_json), taxonomy)
+    if result is None:
+        raise ValueError("Invalid summary")
+    return _item_summary(result, payload, taxonomy, keywords)
+
+
+def summarize_item(item, model=None, tab="ai", skip_cache_lookup=False):
+    payload, taxonomy, keywords, model_name, cache_payload = _item_context(item, tab, model)
+    if not skip_cache_lookup:
+        cached = response_cache.lookup("item", model_name, cache_payload)
+        if cached is not None:
+            return cached
 
     response, error = call_openai(
-        messages=[
-            {"role": "system", "content": "You output only valid JSON."},
-            {"role": "user", "content": prompt},
-        ],
+        messages=_item_messages(payload, taxonomy),
         model=model_name,
         temperature=OPENAI_TEMPERATURE_ITEM,
+        response_format=_item_format(taxonomy),
     )
     if error or response is None:
         print(f"[LLM] OpenAI summary failed, using fallback: {error}")
@@ -401,39 +508,198 @@ def summarize_item(item, model=None, tab="ai"):
 
     try:
         content = response.choices[0].message.content or ""
-        extracted = extract_json(content)
-        if not extracted:
-            raise ValueError("Empty or invalid JSON payload")
-        result = json.loads(extracted)
-        if not isinstance(result.get("summary"), list):
-            raise ValueError("Invalid summary")
-        topics = normalize_topics(
-            result.get("topics"),
-            f"{payload.get('title', '')} {payload.get('snippet', '')}",
-            taxonomy,
-            keywords,
-        )
-        return {
-            "summary": result.get("summary")[:3],
-            "why": result.get("why") or "",
-            "topics": topics,
-            "status": result.get("status") or "NEW",
-            "importanceScore": int(result.get("importanceScore") or 5),
-        }
+        summary = _parse_item_content(content, payload, taxonomy, keywords)
     except Exception as exc:
         print(f"[LLM] OpenAI summary failed, using fallback: {exc}")
         return fallback_summary(item, taxonomy, keywords)
 
+    response_cache.store("item", model_name, cache_payload, summary)
+    return summary
+
+
+def summarize_item_batch(items, tab="ai", model=None):
+    """Summarize several same-tab items in one request.
+
+    Returns a list aligned with `items`; entries the model left out or returned
+    malformed are None so the caller can retry them one at a time.
+    """
+    contexts = [_item_context(item, tab, model) for item in items]
+    model_name = contexts[0][3]
+    taxonomy = contexts[0][1]
+    entries = [{"id": f"item_{idx}", **context[0]} for idx, context in enumerate(contexts)]
+
+    prompt = (
+        "여러 업데이트를 각각 요약하는 분석가입니다. "
+        "한국어로만 응답하세요. {\"items\": [...]} 형태의 JSON 객체만 반환하세요. "
+        "items에는 입력 항목마다 하나씩, 입력의 id를 그대로 포함한 객체를 넣으세요. "
+        f"{_item_instructions(taxonomy)}"
+        f"Input: {json.dumps(entries, ensure_ascii=False)}"
+    )
+
+    results = [None] * len(items)
+    response, error = call_openai(
+        messages=[
+            {"role": "system", "content": "You output only valid JSON."},
+            {"role": "user", "content": prompt},
+        ],
+        model=model_name,
+        temperature=OPENAI_TEMPERATURE_ITEM,
+        completion_tokens=OPENAI_EXPECTED_COMPLETION_TOKENS * len(items),
+        response_format=schemas.response_format("item_summaries", schemas.item_batch_schema(taxonomy)),
+    )
+    if error or response is None:
+        print(f"[LLM] OpenAI batch summary failed, retrying items singly: {error}")
+        return results
+
+    try:
+        content = response.choices[0].message.content or ""
+        parsed = schemas.unwrap(schemas.load_reply(content, extract_json), "items")
+        if not isinstance(parsed, list):
+            raise ValueError("Expected JSON array")
+    except Exception as exc:
+        print(f"[LLM] OpenAI batch summary failed, retrying items singly: {exc}")
+        return results
+
+    positions = {entry["id"]: idx for idx, entry in enumerate(entries)}
+    for element in parsed:
+        idx = positions.get(element.get("id")) if isinstance(element, dict) else None
+        if idx is None or results[idx] is not None:
+            continue
+        payload, taxonomy, keywords, _, cache_payload = contexts[idx]
+        checked = _check_item({key: value for key, value in element.items() if key != "id"}, taxonomy)
+        if checked is None:
+            continue
+        results[idx] = _item_summary(checked, payload, taxonomy, keywords)
+        response_cache.store("item", model_name, cache_payload, results[idx])
+    return results
+
+
+def summarize_items(items, batch_size=None, skip_cache_lookup=False):
+    """Summarize items (each carrying its own "tab"), returning results in input order.
+
+    Results produced by fallback_summary carry "fallback": True.
+    Cached items are answered locally (each item is looked up once;
+    skip_cache_lookup when the caller already did). Short items are packed
+    `batch_size` per request within a tab; items long enough for the long model,
+    and any element a batch failed to answer, go through summarize_item.
+    """
+    batch_size = batch_size if isinstance(batch_size, int) and batch_size > 0 else OPENAI_ITEM_BATCH_SIZE
+    results = [None] * len(items)
+    pending = {}
+    singles = []
+    for idx, item in enumerate(items):
+        tab = item.get("tab", "ai")
+        _, _, _, model_name, cache_payload = _item_context(item, tab)
+        if not skip_cache_lookup:
+            cached = response_cache.lookup("item", model_name, cache_payload)
+            if cached is not None:
+                results[idx] = cached
+                continue
+        if batch_size <= 1 or model_name == OPENAI_ITEM_MODEL_LONG:
+            singles.append(idx)
+            continue
+        pending.setdefault((tab, model_name), []).append(idx)
+
+    batches = []
+    for (tab, _), indexes in pending.items():
+        for start in range(0, len(indexes), batch_size):
+            batches.append((tab, indexes[start : start + batch_size]))
+
+    def run_batch(batch):
+        tab, indexes = batch
+        if len(indexes) == 1:
+            return [None]
+        stats.incr("itemBatchCalls")
+        return summarize_item_batch([items[idx] for idx in indexes], tab=tab)
+
+    for (_, indexes), summaries in zip(batches, scheduler.run_ordered(run_batch, batches)):
+        for idx, summary in zip(indexes, summaries):
+            if summary is None:
+                singles.append(idx)
+            else:
+                results[idx] = summary
+
+    if singles:
+        stats.incr("itemSingleCalls", len(singles))
+    singles.sort()
+    summaries = scheduler.run_ordered(
+        lambda idx: summarize_item(items[idx], tab=items[idx].get("tab", "ai"), skip_cache_lookup=True),
+        singles,
+    )
+    for idx, summary in zip(singles, summaries):
+        results[idx] = summary
+    return results
+
+
+def summarize_items_offline(items):
+    """Like summarize_items, but uncached items go through one Batch API job.
+
+    Items without a usable batch result are summarized synchronously.
+    """
+    results = [None] * len(items)
+    requests = []
+    contexts = {}
+    for idx, item in enumerate(items):
+        tab = item.get("tab", "ai")
+        payload, taxonomy, keywords, model_name, cache_payload = _item_context(item, tab)
+        cached = response_cache.lookup("item", model_name, cache_payload)
+        if cached is not None:
+            results[idx] = cached
+            continue
+        body = {
+            "model": model_name,
+            "messages": _item_messages(payload, taxonomy),
+            "response_format": _item_format(taxonomy),
+        }
+        if OPENAI_TEMPERATURE_ITEM is not None:
+            body["temperature"] = OPENAI_TEMPERATURE_ITEM
+        custom_id = f"item-{idx}"
+        requests.append((custom_id, body))
+        contexts[custom_id] = (idx, payload, taxonomy, keywords, model_name, cache_payload)
+
+    contents = batch_api.run_batch(requests, label="industry_items")
+    for custom_id, (idx, payload, taxonomy, keywords, model_name, cache_payload) in contexts.items():
+        content = contents.get(custom_id)
+        if content is None:
+            continue
+        try:
+            results[idx] = _parse_item_content(content, payload, taxonomy, keywords)
+        except Exception as exc:
+            print(f"[LLM] batch summary for {custom_id} unusable: {exc}")
+            continue
+        response_cache.store("item", model_name, cache_payload, results[idx])
+
+    remaining = [idx for idx, result in enumerate(results) if result is None]
+    if remaining:
+        stats.incr("batchFallbacks", len(remaining))
+        print(f"[LLM] {len(remaining)} items missing from batch results; summarizing synchronously")
+        summaries = summarize_items([items[idx] for idx in remaining], skip_cache_lookup=True)
+        for idx, summary in zip(remaining, summaries):
+            results[idx] = summary
+    return results
+
+
+def _repair_oneliner(element):
+    entry_id = element.get("id")
+    text = element.get("text") or element.get("oneLiner") or element.get("description")
+    if entry_id is None or not isinstance(text, str):
+        return None
+    return {"id": str(entry_id), "text": text}
+
 
 def summarize_developer_oneliners(items, model=None):
     if not items:
         return {}
 
     model_name = model or OPENAI_ITEM_MODEL_SHORT or OPENAI_ITEM_MODEL
+    cached = response_cache.lookup("oneliners", model_name, items)
+    if cached is not None:
+        return cached
+
     prompt = (
         "개발자 레이더 카드의 한 줄 설명을 생성하세요. "
         "한국어로만 응답하고 JSON 객체만 반환하세요. "
-        "형식: {\"<id>\": \"한 문장\", ...}. "
+        "형식: {\"oneliners\": [{\"id\": \"<id>\", \"text\": \"한 문장\"}, ...]}. "
         "각 문장은 1문장, 60자 내외, 따옴표/이모지 금지. "
         "입력에 없는 사실, 수치, 비교, 과장 표현을 추가하지 마세요. "
         "title/name/description/url/tags/section 정보만 사용하세요. "
@@ -446,6 +712,7 @@ def summarize_developer_oneliners(items, model=None):
             {"role": "user", "content": prompt},
         ],
         model=model_name,
+        response_format=schemas.response_format("oneliners", schemas.ONELINERS_SCHEMA),
     )
     if error or response is None:
         print(f"[LLM] OpenAI oneliner failed, using fallback: {error}")
@@ -453,21 +720,25 @@ def summarize_developer_oneliners(items, model=None):
 
     try:
         content = response.choices[0].message.content or ""
-        extracted = extract_json(content)
-        if not extracted:
-            raise ValueError("Empty or invalid JSON payload")
-        result = json.loads(extracted)
-        if not isinstance(result, dict):
+        result = schemas.unwrap(schemas.load_reply(content, extract_json), "oneliners")
+        if isinstance(result, dict):
+            # Older {"<id>": "text"} shape.
+            result = [{"id": key, "text": value} for key, value in result.items()]
+        if not isinstance(result, list):
             raise ValueError("Invalid oneliner result")
+        element_schema = schemas.ONELINERS_SCHEMA["properties"]["oneliners"]["items"]
+        kept, _ = schemas.check_elements(result, element_schema, _repair_oneliner)
         cleaned = {}
-        for key, value in result.items():
-            if isinstance(value, str) and value.strip():
-                cleaned[key] = normalize_text(value)
-        return cleaned
+        for entry in kept:
+            if entry["text"].strip():
+                cleaned[entry["id"]] = normalize_text(entry["text"])
     except Exception as exc:
         print(f"[LLM] OpenAI oneliner failed, using fallback: {exc}")
         return {}
 
+    response_cache.store("oneliners", model_name, items, cleaned)
+    return cleaned
+
 
 def _resolve_daily_highlight_lines(items, desired_lines=None):
     count = len(items or [])
@@ -557,6 +828,11 @@ def summarize_daily_highlights(items, tab="ai", model=None, desired_lines=None):
             }
         )
 
+    cache_payload = {"samples": samples, "lines": line_target, "tab": tab}
+    cached = response_cache.lookup("highlights", model_name, cache_payload)
+    if cached is not None:
+        return cached
+
     if line_target == 1:
         format_hint = '{"bullets": ["핵심: ..."]}'
         structure_hint = "반드시 정확히 1문장으로 작성하세요."
@@ -589,6 +865,7 @@ def summarize_daily_highlights(items, tab="ai", model=None, desired_lines=None):
         ],
         model=model_name,
         temperature=OPENAI_TEMPERATURE_ITEM,
+        response_format=schemas.response_format("daily_highlights", schemas.HIGHLIGHTS_SCHEMA),
     )
     if error or response is None:
         print(f"[LLM] OpenAI daily highlights failed, using fallback: {error}")
@@ -596,10 +873,7 @@ def summarize_daily_highlights(items, tab="ai", model=None, desired_lines=None):
 
     try:
         content = response.choices[0].message.content or ""
-        extracted = extract_json(content)
-        if not extracted:
-            raise ValueError("Empty or invalid JSON payload")
-        result = json.loads(extracted)
+        result = schemas.load_reply(content, extract_json)
         bullets = result.get("bullets") if isinstance(result, dict) else None
         if not isinstance(bullets, list):
             raise ValueError("Invalid bullets")
@@ -621,11 +895,14 @@ def summarize_daily_highlights(items, tab="ai", model=None, desired_lines=None):
 
         if len(cleaned) != line_target:
             raise ValueError("Insufficient bullets")
-        return {"bullets": cleaned}
     except Exception as exc:
         print(f"[LLM] OpenAI daily highlights failed, using fallback: {exc}")
         return fallback_daily_highlights(items, tab=tab, desired_lines=line_target)
 
+    highlights = {"bullets": cleaned}
+    response_cache.store("highlights", model_name, cache_payload, highlights)
+    return highlights
+
 
 def fallback_issue_summary(items, max_items=5):
     issues = []
@@ -653,6 +930,36 @@ def fallback_issue_summary(items, max_items=5):
     return issues
 
 
+def _repair_issue(element):
+    if not isinstance(element.get("title"), str) or not element["title"].strip():
+        return None
+    fixed = {
+        key: element.get(key)
+        for key in ("id", "status", "title", "summary", "articleCount", "relatedArticles")
+    }
+    fixed["id"] = str(fixed["id"] or "")
+    if fixed.get("status") not in schemas.ITEM_STATUSES:
+        fixed["status"] = "NEW"
+    if not isinstance(fixed.get("summary"), str):
+        fixed["summary"] = " ".join(fixed["summary"]) if isinstance(fixed.get("summary"), list) else ""
+    try:
+        fixed["articleCount"] = max(1, int(fixed.get("articleCount")))
+    except (TypeError, ValueError):
+        fixed["articleCount"] = 1
+    related = []
+    for article in fixed.get("relatedArticles") or []:
+        if isinstance(article, dict) and article.get("url"):
+            related.append(
+                {
+                    "title": str(article.get("title") or ""),
+                    "source": str(article.get("source") or ""),
+                    "url": str(article["url"]),
+                }
+            )
+    fixed["relatedArticles"] = related[:3]
+    return fixed
+
+
 def summarize_issues(items, model=None, max_items=5, tab="ai"):
     if not items:
         return fallback_issue_summary(items, max_items=max_items)
@@ -672,10 +979,15 @@ def summarize_issues(items, model=None, max_items=5, tab="ai"):
             }
         )
 
+    cache_payload = {"samples": samples, "maxItems": max_items, "tab": tab}
+    cached = response_cache.lookup("issues", model_name, cache_payload)
+    if cached is not None:
+        return cached
+
     prompt = (
         "주간/월간 업데이트를 주요 이슈로 재요약하세요. "
-        "한국어로만 응답하고 JSON 배열만 반환하세요. "
-        "각 항목은 id, status(NEW|ONGOING|SHIFTING), title, summary, articleCount, "
+        "한국어로만 응답하고 {\"issues\": [...]} 형태의 JSON 객체만 반환하세요. "
+        "issues의 각 항목은 id, status(NEW|ONGOING|SHIFTING), title, summary, articleCount, "
         "relatedArticles(최대 3개, source/title/url 포함) 키를 포함해야 합니다. "
         "주제 다양성을 확보하고 같은 주제 반복을 피하세요. "
         f"대상 탭: {tab}. "
@@ -689,6 +1001,7 @@ def summarize_issues(items, model=None, max_items=5, tab="ai"):
         ],
         model=model_name,
         temperature=OPENAI_TEMPERATURE_ISSUE,
+        response_format=schemas.response_format("issues", schemas.ISSUES_SCHEMA),
     )
     if error or response is None:
         print(f"[LLM] OpenAI issues summary failed, using fallback: {error}")
@@ -696,20 +1009,20 @@ def summarize_issues(items, model=None, max_items=5, tab="ai"):
 
     try:
         content = response.choices[0].message.content or ""
-        extracted = extract_json(content)
-        if not extracted:
-            raise ValueError("Empty or invalid JSON payload")
-        result = json.loads(extracted)
+        result = schemas.unwrap(schemas.load_reply(content, extract_json), "issues")
         if not isinstance(result, list):
             raise ValueError("Invalid issues")
-        trimmed = result[:max_items]
+        element_schema = schemas.ISSUES_SCHEMA["properties"]["issues"]["items"]
+        trimmed, _ = schemas.check_elements(result, element_schema, _repair_issue)
+        if not trimmed:
+            raise ValueError("No usable issues")
+        trimmed = trimmed[:max_items]
         for idx, issue in enumerate(trimmed, start=1):
-            issue.setdefault("id", f"issue_{idx:03d}")
-            issue.setdefault("status", "NEW")
-            issue.setdefault("summary", "")
-            issue.setdefault("articleCount", 1)
-            issue.setdefault("relatedArticles", [])
-        return trimmed
+            if not issue["id"]:
+                issue["id"] = f"issue_{idx:03d}"
     except Exception as exc:
         print(f"[LLM] OpenAI issues summary failed, using fallback: {exc}")
         return fallback_issue_summary(items, max_items=max_items)
+
+    response_cache.store("issues", model_name, cache_payload, trimmed)
+    return trimmed
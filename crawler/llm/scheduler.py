@@ -0,0 +1,93 @@
+import random
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from ..config import (
+    OPENAI_EXPECTED_COMPLETION_TOKENS,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+)
+from ..ratelimit import RateLimiter
+from . import stats
+
+
+# Shared by every thread in the process so concurrent callers stay within the
+# account's requests-per-minute and tokens-per-minute budgets.
+request_limiter = RateLimiter(OPENAI_RPM_LIMIT)
+token_limiter = RateLimiter(OPENAI_TPM_LIMIT)
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_reset(value):
+    # x-ratelimit-reset-* values look like "1s", "6m0s" or "20ms".
+    if not value:
+        return None
+    total = 0.0
+    for amount, unit in _DURATION_RE.findall(str(value)):
+        total += float(amount) * _DURATION_UNITS[unit]
+    return total or None
+
+
+def _header_int(headers, name):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(messages, completion_tokens=None):
+    chars = sum(len(message.get("content") or "") for message in messages)
+    if completion_tokens is None:
+        completion_tokens = OPENAI_EXPECTED_COMPLETION_TOKENS
+    # Korean prompts run close to two characters per token.
+    return chars // 2 + completion_tokens
+
+
+def acquire(messages, completion_tokens=None):
+    request_limiter.acquire(1)
+    token_limiter.acquire(estimate_tokens(messages, completion_tokens))
+
+
+def observe_headers(headers):
+    if not headers:
+        return
+    request_limiter.sync(
+        _header_int(headers, "x-ratelimit-remaining-requests"),
+        parse_reset(headers.get("x-ratelimit-reset-requests")),
+    )
+    token_limiter.sync(
+        _header_int(headers, "x-ratelimit-remaining-tokens"),
+        parse_reset(headers.get("x-ratelimit-reset-tokens")),
+    )
+
+
+def backoff(exc, attempt):
+    """Pause every caller after a 429, preferring the server's retry hint."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    observe_headers(headers)
+    delay = None
+    try:
+        if headers.get("retry-after-ms"):
+            delay = float(headers["retry-after-ms"]) / 1000
+        elif headers.get("retry-after"):
+            delay = float(headers["retry-after"])
+    except (TypeError, ValueError):
+        delay = None
+    if delay is None:
+        delay = min(60.0, 2 ** attempt)
+    delay += random.uniform(0, 1)
+    stats.incr("rateLimitBackoffs")
+    request_limiter.pause(delay)
+
+
+def run_ordered(fn, items, workers=None):
+    """Apply fn to every item concurrently and return results in input order."""
+    workers = workers if isinstance(workers, int) and workers > 0 else OPENAI_MAX_CONCURRENCY
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(fn, items))
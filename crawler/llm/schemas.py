@@ -0,0 +1,191 @@
+import json
+
+from . import stats
+
+
+# JSON schemas sent as `response_format` (structured outputs) for each call type.
+# Strict mode requires object roots, every property listed in `required` and
+# `additionalProperties: false`, so array results are wrapped in an object.
+# validate() re-checks replies locally because mocks and non-OpenAI backends may
+# ignore the schema; repair helpers fix what they can element by element.
+
+ITEM_STATUSES = ["NEW", "ONGOING", "SHIFTING"]
+
+
+def response_format(name, schema):
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
+
+
+def _object(properties):
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _array(items):
+    return {"type": "array", "items": items}
+
+
+def _string_enum(choices):
+    return {"type": "string", "enum": list(choices)}
+
+
+def item_properties(taxonomy):
+    return {
+        "summary": _array({"type": "string"}),
+        "why": {"type": "string"},
+        "topics": _array(_string_enum(taxonomy)),
+        "status": _string_enum(ITEM_STATUSES),
+        "importanceScore": {"type": "integer"},
+    }
+
+
+def item_schema(taxonomy):
+    return _object(item_properties(taxonomy))
+
+
+def item_batch_schema(taxonomy):
+    return _object({"items": _array(_object({"id": {"type": "string"}, **item_properties(taxonomy)}))})
+
+
+ONELINERS_SCHEMA = _object(
+    {"oneliners": _array(_object({"id": {"type": "string"}, "text": {"type": "string"}}))}
+)
+
+HIGHLIGHTS_SCHEMA = _object({"bullets": _array({"type": "string"})})
+
+ISSUES_SCHEMA = _object(
+    {
+        "issues": _array(
+            _object(
+                {
+                    "id": {"type": "string"},
+                    "status": _string_enum(ITEM_STATUSES),
+                    "title": {"type": "string"},
+                    "summary": {"type": "string"},
+                    "articleCount": {"type": "integer"},
+                    "relatedArticles": _array(
+                        _object(
+                            {
+                                "title": {"type": "string"},
+                                "source": {"type": "string"},
+                                "url": {"type": "string"},
+                            }
+                        )
+                    ),
+                }
+            )
+        )
+    }
+)
+
+
+def market_schema(type_choices, area_choices):
+    return _object(
+        {
+            "items": _array(
+                _object(
+                    {
+                        "id": {"type": "string"},
+                        "keep": {"type": "boolean"},
+                        "oneLiner": {"type": "string"},
+                        "type_raw": _string_enum(type_choices),
+                        "areas_raw": _array(_string_enum(area_choices)),
+                        "confidence": {"type": "number"},
+                    }
+                )
+            )
+        }
+    )
+
+
+_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "boolean": bool,
+}
+
+
+def validate(value, schema, path="$"):
+    """Return a list of "path: problem" strings; empty means `value` matches."""
+    kind = schema.get("type")
+    if kind == "integer":
+        ok = isinstance(value, int) and not isinstance(value, bool)
+    elif kind == "number":
+        ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        ok = isinstance(value, _TYPES.get(kind, object))
+    if not ok:
+        return [f"{path}: expected {kind}"]
+    if "enum" in schema and value not in schema["enum"]:
+        return [f"{path}: {value!r} not allowed"]
+
+    errors = []
+    if kind == "object":
+        properties = schema.get("properties") or {}
+        for name in schema.get("required") or []:
+            if name not in value:
+                errors.append(f"{path}.{name}: missing")
+        for name, item in value.items():
+            if name in properties:
+                errors.extend(validate(item, properties[name], f"{path}.{name}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}.{name}: unexpected")
+    elif kind == "array":
+        for idx, item in enumerate(value):
+            errors.extend(validate(item, schema["items"], f"{path}[{idx}]"))
+    return errors
+
+
+def load_reply(content, extract_json):
+    """Parse a reply that should already be schema-shaped JSON.
+
+    Falls back to bracket scanning (extract_json) for backends that ignore
+    response_format; the counters show how often that still happens.
+    """
+    try:
+        parsed = json.loads(content)
+        stats.incr("structuredReplies")
+        return parsed
+    except (TypeError, ValueError):
+        pass
+    extracted = extract_json(content)
+    if not extracted:
+        raise ValueError("Empty or invalid JSON payload")
+    stats.incr("structuredReparsed")
+    return json.loads(extracted)
+
+
+def unwrap(parsed, key):
+    # Structured replies wrap arrays ({"items": [...]}); legacy replies are bare.
+    if isinstance(parsed, dict) and key in parsed:
+        return parsed[key]
+    return parsed
+
+
+def check_elements(elements, schema, repair):
+    """Validate each element of an array reply, repairing or dropping bad ones.
+
+    `repair(element)` returns a fixed element or None. Returns (kept, rejected).
+    """
+    kept = []
+    rejected = []
+    for element in elements:
+        if not validate(element, schema):
+            kept.append(element)
+            continue
+        fixed = repair(element) if isinstance(element, dict) else None
+        if fixed is not None and not validate(fixed, schema):
+            stats.incr("structuredRepaired")
+            kept.append(fixed)
+        else:
+            stats.incr("structuredRejected")
+            rejected.append(element)
+    return kept, rejected
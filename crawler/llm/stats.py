@@ -0,0 +1,35 @@
+import threading
+from collections import Counter
+
+
+# Process-wide LLM counters (cache hits, API calls, retries, ...). Pipelines copy a
+# snapshot into run_stats["llm"] at the end of a run.
+_counts = Counter()
+_timings = {}
+_lock = threading.Lock()
+
+
+def incr(name, value=1):
+    with _lock:
+        _counts[name] += value
+
+
+def observe(name, value):
+    with _lock:
+        count, total, peak = _timings.get(name, (0, 0.0, 0.0))
+        _timings[name] = (count + 1, total + value, max(peak, value))
+
+
+def snapshot():
+    with _lock:
+        result = dict(_counts)
+        for name, (count, total, peak) in _timings.items():
+            result[f"{name}Avg"] = round(total / count, 1) if count else 0
+            result[f"{name}Max"] = round(peak, 1)
+        return result
+
+
+def reset():
+    with _lock:
+        _counts.clear()
+        _timings.clear()
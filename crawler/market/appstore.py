@@ -1,14 +1,16 @@
-import requests
-
 from crawler.config import TIMEZONE
+from crawler.http.client import http_get
 from crawler.utils import format_date, normalize_text, parse_datetime, sha1_text
 
 
 LOOKUP_URL = "https://itunes.apple.com/lookup"
+# The lookup endpoint takes a comma-separated id list; larger app lists are
+# split into requests of this many ids.
+LOOKUP_BATCH_SIZE = 100
 
 
 def fetch_app(track_id, country="kr"):
-    response = requests.get(
+    response = http_get(
         LOOKUP_URL,
         params={"id": str(track_id), "country": country},
         timeout=30,
@@ -21,6 +23,42 @@ def fetch_app(track_id, country="kr"):
     return results[0]
 
 
+def fetch_apps(track_ids, country="kr", batch_size=LOOKUP_BATCH_SIZE):
+    """Look up several apps per request.
+
+    Returns ({trackId: entry}, {trackId: exception}) keyed by str(trackId); an
+    id is in exactly one of the two. A failed request fails every id it carried.
+    """
+    ids = list(dict.fromkeys(str(track_id) for track_id in track_ids))
+    found = {}
+    failed = {}
+    for offset in range(0, len(ids), batch_size):
+        chunk = ids[offset : offset + batch_size]
+        try:
+            response = http_get(
+                LOOKUP_URL,
+                params={"id": ",".join(chunk), "country": country},
+                timeout=30,
+            )
+            response.raise_for_status()
+            results = response.json().get("results") or []
+        except Exception as exc:
+            for track_id in chunk:
+                failed[track_id] = exc
+            continue
+        wanted = set(chunk)
+        for result in results:
+            track_id = str(result.get("trackId"))
+            if track_id in wanted:
+                found.setdefault(track_id, result)
+        for track_id in chunk:
+            if track_id not in found:
+                failed[track_id] = RuntimeError(
+                    f"App Store lookup returned 0 results: trackId={track_id}"
+                )
+    return found, failed
+
+
 def _in_range(dt, start, end):
     if not dt:
         return False
@@ -33,17 +71,15 @@ def _in_range(dt, start, end):
 
 def build_items(apps, start, end, now, country="kr", on_failure=None, on_fetched=None):
     items = []
+    apps = [app for app in apps if app.get("trackId") and app.get("company")]
+    entries, failed = fetch_apps([app["trackId"] for app in apps], country=country)
     for app in apps:
-        track_id = app.get("trackId")
-        company = app.get("company")
-        if not track_id or not company:
-            continue
-
-        try:
-            entry = fetch_app(track_id, country=country)
-        except Exception as exc:
+        track_id = app["trackId"]
+        company = app["company"]
+        entry = entries.get(str(track_id))
+        if entry is None:
             if on_failure:
-                on_failure(company, track_id, exc)
+                on_failure(company, track_id, failed[str(track_id)])
             continue
 
         if on_fetched:
@@ -0,0 +1,99 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from crawler.config import (
+    SECURITIES_CACHE_DIR,
+    SECURITIES_CACHE_TTL_DAYS,
+    SECURITIES_CACHE_VACUUM_RATIO,
+)
+from crawler.market.news_rss import canonical_news_id
+
+
+# Enrichment results per securities dataset, keyed by item id. Replaces the
+# append-only archive/securities/<dataset>/cache.jsonl: lookups are point
+# queries, re-enriched ids overwrite their row, and rows unseen for
+# SECURITIES_CACHE_TTL_DAYS expire. A store that has never been seeded imports
+# the legacy JSONL once (later lines win), so a cold .cache starts from it.
+SCHEMA_VERSION = 1
+
+
+class EnrichmentCache:
+    def __init__(self, dataset, legacy_path=None):
+        path = SECURITIES_CACHE_DIR / f"{dataset}.sqlite3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), isolation_level=None)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id TEXT PRIMARY KEY, created_at REAL NOT NULL, last_seen REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_last_seen ON entries (last_seen)")
+        self.migrated = 0
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
+            if legacy_path and Path(legacy_path).exists():
+                self.migrated = self._import_legacy(legacy_path)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _import_legacy(self, legacy_path):
+        entries = {}
+        with Path(legacy_path).open("r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                payload = json.loads(line)
+                entry_id = canonical_news_id(payload.get("id"))
+                if entry_id:
+                    entries[entry_id] = {**payload, "id": entry_id}
+        self._upsert(entries.values())
+        return len(entries)
+
+    def _upsert(self, entries):
+        now = time.time()
+        self.conn.execute("BEGIN")
+        self.conn.executemany(
+            "INSERT INTO entries (id, created_at, last_seen, value) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET last_seen = excluded.last_seen, value = excluded.value",
+            [(entry["id"], now, now, json.dumps(entry, ensure_ascii=False)) for entry in entries],
+        )
+        self.conn.execute("COMMIT")
+
+    def lookup_many(self, ids):
+        """{id: cached entry} for the ids present and not expired."""
+        cutoff = time.time() - SECURITIES_CACHE_TTL_DAYS * 86400
+        found = {}
+        for entry_id in dict.fromkeys(ids):
+            row = self.conn.execute(
+                "SELECT value FROM entries WHERE id = ? AND last_seen >= ?", (entry_id, cutoff)
+            ).fetchone()
+            if row:
+                found[entry_id] = json.loads(row[0])
+        return found
+
+    def store_many(self, entries):
+        """Insert or replace entries ({"id": ..., **result}); refreshes last_seen."""
+        if entries:
+            self._upsert(entries)
+
+    def close(self):
+        """Expire old rows, vacuum once enough pages are free, and close.
+        Returns the stats reported in run.json."""
+        cutoff = time.time() - SECURITIES_CACHE_TTL_DAYS * 86400
+        expired = self.conn.execute("DELETE FROM entries WHERE last_seen < ?", (cutoff,)).rowcount
+        (page_count,) = self.conn.execute("PRAGMA page_count").fetchone()
+        (free_pages,) = self.conn.execute("PRAGMA freelist_count").fetchone()
+        vacuumed = bool(page_count) and free_pages > page_count * SECURITIES_CACHE_VACUUM_RATIO
+        if vacuumed:
+            self.conn.execute("VACUUM")
+            (page_count,) = self.conn.execute("PRAGMA page_count").fetchone()
+        (page_size,) = self.conn.execute("PRAGMA page_size").fetchone()
+        (entries,) = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        self.conn.close()
+        return {
+            "entries": entries,
+            "migrated": self.migrated,
+            "expired": expired,
+            "vacuumed": vacuumed,
+            "bytes": page_count * page_size,
+        }
@@ -1,56 +1,166 @@
 import io
+import json
 import re
+import time
 import zipfile
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
-import requests
+from crawler.config import (
+    DART_CORP_CODE_CACHE_PATH,
+    DART_CORP_CODE_TTL_DAYS,
+    DART_MARKET_SLICE_DAYS,
+    DART_MAX_CONCURRENCY,
+    DART_RPM_LIMIT,
+)
+from crawler.http.client import http_get
+from crawler.ratelimit import RateLimiter
 
 
 CORP_CODE_URL = "https://opendart.fss.or.kr/api/corpCode.xml"
 LIST_URL = "https://opendart.fss.or.kr/api/list.json"
 
 
+_CORP_NAME_SUFFIXES = re.compile(r"\(주\)|㈜|주식회사")
+_CORP_NAME_STRIP = re.compile(r"[^a-z0-9가-힣]+")
+
+
 def normalize_corp_name(name):
     if not name:
         return ""
-    lowered = name.lower()
-    lowered = re.sub(r"\(주\)|㈜|주식회사", "", lowered)
-    lowered = re.sub(r"\s+", "", lowered)
-    lowered = re.sub(r"[^a-z0-9가-힣]", "", lowered)
-    return lowered
+    lowered = _CORP_NAME_SUFFIXES.sub("", name.lower())
+    # Whitespace is outside the kept character set, so this also drops it.
+    return _CORP_NAME_STRIP.sub("", lowered)
 
 
-def fetch_corp_codes(api_key):
-    response = requests.get(CORP_CODE_URL, params={"crtfc_key": api_key}, timeout=30)
+def _parse_corp_codes(file):
+    # Streams the corpCode XML; each <list> element is dropped once read.
+    corp_entries = []
+    root = None
+    for event, elem in ET.iterparse(file, events=("start", "end")):
+        if root is None:
+            root = elem
+        elif event == "end" and elem.tag == "list":
+            corp_entries.append(
+                {
+                    "corp_code": elem.findtext("corp_code"),
+                    "corp_name": elem.findtext("corp_name"),
+                }
+            )
+            root.clear()
+    return corp_entries
+
+
+def download_corp_codes(api_key):
+    response = http_get(CORP_CODE_URL, params={"crtfc_key": api_key}, timeout=30)
     response.raise_for_status()
     with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
         members = archive.namelist()
         if not members:
             raise RuntimeError("DART corpCode zip is empty")
         with archive.open(members[0]) as file:
-            xml_bytes = file.read()
+            return _parse_corp_codes(file)
 
-    root = ET.fromstring(xml_bytes)
-    corp_entries = []
-    for item in root.findall("list"):
-        corp_entries.append(
-            {
-                "corp_code": item.findtext("corp_code"),
-                "corp_name": item.findtext("corp_name"),
-            }
-        )
+
+def _read_corp_code_cache():
+    try:
+        payload = json.loads(DART_CORP_CODE_CACHE_PATH.read_text(encoding="utf-8"))
+        entries = [
+            {"corp_code": corp_code, "corp_name": corp_name}
+            for corp_code, corp_name in payload["entries"]
+        ]
+        return payload["fetchedAt"], entries
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+
+def _write_corp_code_cache(corp_entries):
+    payload = {
+        "fetchedAt": time.time(),
+        "entries": [[entry["corp_code"], entry["corp_name"]] for entry in corp_entries],
+    }
+    DART_CORP_CODE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = DART_CORP_CODE_CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(DART_CORP_CODE_CACHE_PATH)
+
+
+def fetch_corp_codes(api_key):
+    """All DART corp codes; served from the local cache until it is older than
+    DART_CORP_CODE_TTL_DAYS, and from the stale copy if the download fails.
+    """
+    fetched_at, cached = _read_corp_code_cache()
+    if cached and time.time() - fetched_at < DART_CORP_CODE_TTL_DAYS * 86400:
+        return cached
+    try:
+        corp_entries = download_corp_codes(api_key)
+    except Exception as exc:
+        if not cached:
+            raise
+        print(f"[dart] corpCode download failed, using cached list: {exc!r}")
+        return cached
+    try:
+        _write_corp_code_cache(corp_entries)
+    except OSError as exc:
+        print(f"[dart] corpCode cache write failed: {exc}")
     return corp_entries
 
 
-def build_corp_code_map(companies, api_key, overrides=None):
-    overrides = overrides or {}
-    corp_entries = fetch_corp_codes(api_key)
-    normalized = {}
+def _bigrams(text):
+    return {text[idx : idx + 2] for idx in range(len(text) - 1)}
+
+
+def build_corp_index(corp_entries):
+    """Normalized corp name -> entries; the bigram -> names index used by the
+    contains-match fallback is built on first use."""
+    names = {}
     for entry in corp_entries:
         normalized_name = normalize_corp_name(entry.get("corp_name"))
         if normalized_name:
-            normalized.setdefault(normalized_name, []).append(entry)
+            names.setdefault(normalized_name, []).append(entry)
+    return {"names": names, "bigrams": None}
+
+
+def _contains_matches(index, key):
+    # A name containing `key` carries every bigram of it, so only the names
+    # listed under key's rarest bigram need the substring check.
+    if not key:
+        return []
+    if len(key) < 2:
+        pool = index["names"]
+    else:
+        if index["bigrams"] is None:
+            bigrams = {}
+            for normalized_name in index["names"]:
+                for bigram in _bigrams(normalized_name):
+                    bigrams.setdefault(bigram, []).append(normalized_name)
+            index["bigrams"] = bigrams
+        pool = min((index["bigrams"].get(bigram, ()) for bigram in _bigrams(key)), key=len)
+    return [
+        entry
+        for normalized_name in pool
+        if key in normalized_name
+        for entry in index["names"][normalized_name]
+    ]
+
+
+_corp_index = None
+
+
+def corp_index(corp_entries):
+    """Shared build_corp_index() result for a corp entry list."""
+    global _corp_index
+    if _corp_index is None or _corp_index[0] is not corp_entries:
+        _corp_index = (corp_entries, build_corp_index(corp_entries))
+    return _corp_index[1]
+
+
+def build_corp_code_map(companies, api_key, overrides=None, corp_entries=None):
+    overrides = overrides or {}
+    if corp_entries is None:
+        corp_entries = fetch_corp_codes(api_key)
+    index = corp_index(corp_entries)
 
     result = {}
     unmatched = []
@@ -60,17 +170,13 @@ def build_corp_code_map(companies, api_key, overrides=None):
             continue
 
         key = normalize_corp_name(name)
-        candidates = normalized.get(key, [])
+        candidates = index["names"].get(key, [])
         if len(candidates) == 1:
             result[name] = candidates[0]["corp_code"]
             continue
         if not candidates:
             # try contains match
-            matches = [
-                entry for normalized_name, entries in normalized.items()
-                if key and key in normalized_name
-                for entry in entries
-            ]
+            matches = _contains_matches(index, key)
             if len(matches) == 1:
                 result[name] = matches[0]["corp_code"]
                 continue
@@ -79,6 +185,149 @@ def build_corp_code_map(companies, api_key, overrides=None):
     return result, unmatched
 
 
+_list_limiter = RateLimiter(DART_RPM_LIMIT, burst=DART_MAX_CONCURRENCY)
+
+
+def _list_page(api_key, query, page_no):
+    """(entries, total_page) for one list.json page; query holds the filters."""
+    _list_limiter.acquire()
+    params = {"crtfc_key": api_key, **query, "page_no": page_no, "page_count": 100}
+    response = http_get(LIST_URL, params=params, timeout=30)
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("status") == "013":
+        return [], 0
+    if payload.get("status") != "000":
+        raise RuntimeError(f"DART list error: {payload}")
+    return payload.get("list", []), int(payload.get("total_page") or 1)
+
+
+def _run_queries(api_key, queries, workers=None, stats=None):
+    """Entries for every list.json query, each in page order.
+
+    First pages are fetched concurrently, then every remaining page of every
+    query, so no worker waits on another and results keep sequential order.
+    """
+    workers = workers if isinstance(workers, int) and workers > 0 else DART_MAX_CONCURRENCY
+
+    def run(fn, jobs):
+        if workers <= 1 or len(jobs) <= 1:
+            return [fn(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            return list(executor.map(fn, jobs))
+
+    first = run(lambda query: _list_page(api_key, query, 1), queries)
+    rest_jobs = [
+        (idx, page_no)
+        for idx, (_entries, total_page) in enumerate(first)
+        for page_no in range(2, total_page + 1)
+    ]
+    rest = run(lambda job: _list_page(api_key, queries[job[0]], job[1])[0], rest_jobs)
+    if stats is not None:
+        stats["listRequests"] = stats.get("listRequests", 0) + len(first) + len(rest_jobs)
+
+    results = [list(entries) for entries, _total_page in first]
+    for (idx, _page_no), entries in zip(rest_jobs, rest):
+        results[idx].extend(entries)
+    for query, entries in zip(queries, results):
+        if query.get("pblntf_ty"):
+            # Keep track of which disclosure group this came from for downstream filtering/debug.
+            for entry in entries:
+                entry["_pblntf_ty"] = query["pblntf_ty"]
+    return results
+
+
+def _types(pblntf_ty):
+    if not pblntf_ty:
+        return [None]
+    if isinstance(pblntf_ty, (list, tuple, set)):
+        return list(pblntf_ty)
+    return [pblntf_ty]
+
+
+def _query(start_date, end_date, p_ty, last_reprt_at, corp_code=None):
+    query = {"bgn_de": start_date.strftime("%Y%m%d"), "end_de": end_date.strftime("%Y%m%d")}
+    if corp_code:
+        query["corp_code"] = corp_code
+    if p_ty:
+        query["pblntf_ty"] = p_ty
+    if last_reprt_at:
+        query["last_reprt_at"] = last_reprt_at
+    return query
+
+
+def list_disclosures_many(
+    api_key,
+    corp_codes,
+    start_date,
+    end_date,
+    *,
+    pblntf_ty=None,
+    last_reprt_at=None,
+    workers=None,
+    stats=None,
+):
+    """{corp_code: list_disclosures(...)} with every request run concurrently."""
+    types = _types(pblntf_ty)
+    corp_codes = list(dict.fromkeys(corp_codes))
+    queries = [
+        _query(start_date, end_date, p_ty, last_reprt_at, corp_code)
+        for corp_code in corp_codes
+        for p_ty in types
+    ]
+    results = iter(_run_queries(api_key, queries, workers=workers, stats=stats))
+    by_corp = {}
+    for corp_code in corp_codes:
+        merged = []
+        for _p_ty in types:
+            merged.extend(next(results))
+        by_corp[corp_code] = merged
+    return by_corp
+
+
+def _date_slices(start_date, end_date, days):
+    # Newest slice first, matching list.json's newest-first order within a slice.
+    slices = []
+    slice_end = end_date
+    while slice_end.date() >= start_date.date():
+        slice_start = max(start_date, slice_end - timedelta(days=days - 1))
+        slices.append((slice_start, slice_end))
+        slice_end = slice_start - timedelta(days=1)
+    return slices
+
+
+def list_market_disclosures(
+    api_key,
+    corp_codes,
+    start_date,
+    end_date,
+    *,
+    pblntf_ty=None,
+    last_reprt_at=None,
+    workers=None,
+    stats=None,
+):
+    """Corp-agnostic variant of list_disclosures_many: lists every filing in the
+    window once per disclosure type (in DART_MARKET_SLICE_DAYS slices) and keeps
+    those of `corp_codes`. Cheaper when the window holds fewer pages of filings
+    than there are companies to ask about (e.g. a --month backfill).
+    """
+    types = _types(pblntf_ty)
+    slices = _date_slices(start_date, end_date, DART_MARKET_SLICE_DAYS)
+    queries = [
+        _query(slice_start, slice_end, p_ty, last_reprt_at)
+        for p_ty in types
+        for slice_start, slice_end in slices
+    ]
+    by_corp = {corp_code: [] for corp_code in dict.fromkeys(corp_codes)}
+    for entries in _run_queries(api_key, queries, workers=workers, stats=stats):
+        for entry in entries:
+            matched = by_corp.get(entry.get("corp_code"))
+            if matched is not None:
+                matched.append(entry)
+    return by_corp
+
+
 def list_disclosures(
     api_key,
     corp_code,
@@ -95,55 +344,14 @@ def list_disclosures(
     - The API accepts a single pblntf_ty per request, so when a list is provided, we fan out
       and merge results.
     """
-
-    def _list_one(p_ty):
-        items = []
-        page_no = 1
-        while True:
-            params = {
-                "crtfc_key": api_key,
-                "corp_code": corp_code,
-                "bgn_de": start_date.strftime("%Y%m%d"),
-                "end_de": end_date.strftime("%Y%m%d"),
-                "page_no": page_no,
-                "page_count": 100,
-            }
-            if p_ty:
-                params["pblntf_ty"] = p_ty
-            if last_reprt_at:
-                params["last_reprt_at"] = last_reprt_at
-
-            response = requests.get(LIST_URL, params=params, timeout=30)
-            response.raise_for_status()
-            payload = response.json()
-            if payload.get("status") == "013":
-                break
-            if payload.get("status") != "000":
-                raise RuntimeError(f"DART list error: {payload}")
-
-            page_items = payload.get("list", [])
-            for entry in page_items:
-                # Keep track of which disclosure group this came from for downstream filtering/debug.
-                if p_ty:
-                    entry["_pblntf_ty"] = p_ty
-                items.append(entry)
-
-            total_page = int(payload.get("total_page") or 1)
-            if page_no >= total_page:
-                break
-            page_no += 1
-        return items
-
-    if not pblntf_ty:
-        return _list_one(None)
-
-    if isinstance(pblntf_ty, (list, tuple, set)):
-        merged = []
-        for ty in pblntf_ty:
-            merged.extend(_list_one(ty))
-        return merged
-
-    return _list_one(pblntf_ty)
+    return list_disclosures_many(
+        api_key,
+        [corp_code],
+        start_date,
+        end_date,
+        pblntf_ty=pblntf_ty,
+        last_reprt_at=last_reprt_at,
+    )[corp_code]
 
 
 def build_disclosure_url(rcept_no):
@@ -1,5 +1,7 @@
 import re
 
+from crawler.textmatch import KeywordMatcher
+
 
 STRONG_KEYWORDS = [
     "ai",
@@ -34,6 +36,10 @@ SOFT_KEYWORDS = [
 ]
 
 
+STRONG_MATCHER = KeywordMatcher(STRONG_KEYWORDS)
+SOFT_MATCHER = KeywordMatcher(SOFT_KEYWORDS)
+
+
 def normalize_for_match(value):
     if not value:
         return ""
@@ -42,10 +48,8 @@ def normalize_for_match(value):
 
 
 def is_ai_candidate(text):
-    lowered = normalize_for_match(text)
-    return any(keyword in lowered for keyword in STRONG_KEYWORDS)
+    return STRONG_MATCHER.search(normalize_for_match(text))
 
 
 def is_soft_candidate(text):
-    lowered = normalize_for_match(text)
-    return any(keyword in lowered for keyword in SOFT_KEYWORDS)
+    return SOFT_MATCHER.search(normalize_for_match(text))
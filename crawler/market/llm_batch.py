@@ -1,7 +1,7 @@
 import json
-import os
 
-from openai import OpenAI
+from crawler.llm import batch_api, schemas, stats
+from crawler.llm.openai_client import call_openai as call_chat
 
 from .taxonomy import AREA_RAW_CHOICES, TYPE_RAW_CHOICES
 
@@ -25,13 +25,6 @@ def extract_json(text):
     return cleaned[start : end + 1]
 
 
-def build_client():
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
-    return OpenAI(api_key=api_key)
-
-
 def build_prompt(items, profile="ai"):
     type_list = ", ".join(TYPE_RAW_CHOICES)
     area_list = ", ".join(AREA_RAW_CHOICES)
@@ -49,8 +42,8 @@ def build_prompt(items, profile="ai"):
 
     prompt = (
         "너는 증권사 관련 이벤트(공시, 앱 업데이트 릴리즈노트, 뉴스)를 분류하는 분석가다. "
-        "한국어로만 응답하고 JSON 배열만 반환해라. "
-        "각 항목은 id, keep(true/false), oneLiner(한두 문장), "
+        "한국어로만 응답하고 {\"items\": [...]} 형태의 JSON 객체만 반환해라. "
+        "items의 각 항목은 id, keep(true/false), oneLiner(한두 문장), "
         f"type_raw({type_list}), areas_raw(배열, {area_list}), confidence(0~1) 키를 포함해야 한다. "
         f"{keep_rule}"
         "타입/영역은 반드시 목록에서만 선택한다. "
@@ -59,35 +52,77 @@ def build_prompt(items, profile="ai"):
     return prompt
 
 
+MARKET_SCHEMA = schemas.market_schema(TYPE_RAW_CHOICES, AREA_RAW_CHOICES)
+MARKET_ELEMENT_SCHEMA = MARKET_SCHEMA["properties"]["items"]["items"]
+MARKET_FORMAT = schemas.response_format("market_events", MARKET_SCHEMA)
+
+
 def call_openai(messages, model):
-    client = build_client()
-    if not client:
-        raise RuntimeError("OPENAI_API_KEY not set")
-    response = client.chat.completions.create(model=model, messages=messages)
+    # Shares the process-wide client, rate limiter and stats with the industry
+    # path; batch callers still rely on exceptions to trigger the halving retry.
+    response, error = call_chat(messages, model, response_format=MARKET_FORMAT)
+    if error or response is None:
+        raise RuntimeError(error or "Empty OpenAI response")
     return response
 
 
+def repair_entry(entry):
+    if not entry.get("id"):
+        return None
+    keep = entry.get("keep")
+    if isinstance(keep, str):
+        keep = keep.strip().lower() == "true"
+    try:
+        confidence = max(0.0, min(1.0, float(entry.get("confidence"))))
+    except (TypeError, ValueError):
+        confidence = 0.5
+    areas = entry.get("areas_raw")
+    if isinstance(areas, str):
+        areas = [areas]
+    areas = [area for area in areas or [] if area in AREA_RAW_CHOICES] or ["기타"]
+    type_raw = entry.get("type_raw")
+    return {
+        "id": str(entry["id"]),
+        "keep": keep is True,
+        "oneLiner": entry.get("oneLiner") if isinstance(entry.get("oneLiner"), str) else "",
+        "type_raw": type_raw if type_raw in TYPE_RAW_CHOICES else "기타",
+        "areas_raw": areas,
+        "confidence": confidence,
+    }
+
+
 def parse_response(content):
-    extracted = extract_json(content)
-    if not extracted:
-        raise ValueError("Invalid JSON response")
-    parsed = json.loads(extracted)
+    parsed = schemas.unwrap(schemas.load_reply(content, extract_json), "items")
     if not isinstance(parsed, list):
         raise ValueError("Expected JSON array")
-    return parsed
+    kept, _ = schemas.check_elements(parsed, MARKET_ELEMENT_SCHEMA, repair_entry)
+    return kept
 
 
-def enrich_batch(items, model="gpt-5-mini", profile="ai"):
-    prompt = build_prompt(items, profile=profile)
+def request_batch(items, model, profile):
     response = call_openai(
         messages=[
             {"role": "system", "content": "You output only valid JSON."},
-            {"role": "user", "content": prompt},
+            {"role": "user", "content": build_prompt(items, profile=profile)},
         ],
         model=model,
     )
-    content = response.choices[0].message.content or ""
-    return parse_response(content)
+    return parse_response(response.choices[0].message.content or "")
+
+
+def enrich_batch(items, model="gpt-5-mini", profile="ai"):
+    enriched = request_batch(items, model, profile)
+    # Re-ask only for the items the reply skipped or got unrepairably wrong,
+    # instead of failing the whole batch into the halving retry.
+    answered = {entry["id"] for entry in enriched}
+    missing = [item for item in items if item.get("id") not in answered]
+    if missing and len(missing) < len(items):
+        stats.incr("elementRetries", len(missing))
+        try:
+            enriched.extend(request_batch(missing, model, profile))
+        except Exception as exc:
+            print(f"[LLM] retry for {len(missing)} unanswered items failed: {exc}")
+    return enriched
 
 
 def enrich_items(items, model="gpt-5-mini", batch_size=12):
@@ -145,3 +180,45 @@ def enrich_items_profile(items, profile, model="gpt-5-mini", batch_size=12):
                 results[entry_id] = entry
         index += batch_size
     return results
+
+
+def enrich_items_offline(items, model="gpt-5-mini", batch_size=12, profile="ai"):
+    # Same prompts as enrich_items_profile, submitted as one Batch API job. Items
+    # that come back missing or unusable are enriched synchronously.
+    requests = []
+    chunks = {}
+    for index in range(0, len(items), batch_size):
+        chunk = items[index : index + batch_size]
+        custom_id = f"chunk-{index // batch_size}"
+        requests.append(
+            (
+                custom_id,
+                {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": "You output only valid JSON."},
+                        {"role": "user", "content": build_prompt(chunk, profile=profile)},
+                    ],
+                    "response_format": MARKET_FORMAT,
+                },
+            )
+        )
+        chunks[custom_id] = chunk
+
+    contents = batch_api.run_batch(requests, label=f"securities_{profile}")
+    results = {}
+    retry = []
+    for custom_id, chunk in chunks.items():
+        try:
+            enriched = parse_response(contents.get(custom_id))
+        except Exception:
+            retry.extend(chunk)
+            continue
+        for entry in enriched:
+            results[entry["id"]] = entry
+        retry.extend(item for item in chunk if item.get("id") not in results)
+
+    if retry:
+        print(f"[LLM] {len(retry)} items missing from batch results; enriching synchronously")
+        results.update(enrich_items_profile(retry, profile, model=model, batch_size=batch_size))
+    return results
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from crawler.config import TIMEZONE
 from crawler.fetchers.rss import fetch_rss_sources
-from crawler.utils import format_date, normalize_text
+from crawler.textmatch import KeywordMatcher
+from crawler.utils import canonical_url, format_date, normalize_text
 
 
 NEWS_RSS_SOURCES = [
@@ -25,22 +28,43 @@ COMPANY_ALIASES = {
 }
 
 
+@lru_cache(maxsize=8)
+def _company_matcher(companies):
+    return KeywordMatcher(
+        [
+            (alias, company)
+            for company in companies
+            for alias in [company] + (COMPANY_ALIASES.get(company) or [])
+        ]
+    )
+
+
+def news_item_id(company, url):
+    return f"news:{company}:{canonical_url(url)}"
+
+
+def canonical_news_id(item_id):
+    # Re-keys ids stored before URLs were canonicalized; other ids pass through.
+    if not item_id or not item_id.startswith("news:"):
+        return item_id
+    company, _, url = item_id[len("news:") :].partition(":")
+    return news_item_id(company, url)
+
+
 def _match_company(text, companies):
-    lowered = (text or "").lower()
-    for company in companies:
-        aliases = [company] + (COMPANY_ALIASES.get(company) or [])
-        for alias in aliases:
-            if not alias:
-                continue
-            if alias.lower() in lowered:
-                return company
-    return None
-
-
-def build_items(companies, start, end):
+    # First company (in list order) with any alias in the text.
+    return _company_matcher(tuple(companies)).first(text)
+
+
+def fetch_entries():
     if not NEWS_RSS_SOURCES:
-        return [], {"entriesFetched": 0, "bySource": {}}
-    raw = fetch_rss_sources(NEWS_RSS_SOURCES, TIMEZONE, max_items=50)
+        return []
+    return fetch_rss_sources(NEWS_RSS_SOURCES, TIMEZONE, max_items=50)
+
+
+def build_items(companies, start, end, entries=None):
+    # `entries` (from fetch_entries) lets several company lists share one fetch.
+    raw = fetch_entries() if entries is None else entries
 
     by_source = {}
     for entry in raw:
@@ -66,7 +90,7 @@ def build_items(companies, start, end):
         url = entry.get("url")
         if not url:
             continue
-        item_id = f"news:{company}:{url}"
+        item_id = news_item_id(company, url)
         items.append(
             {
                 "id": item_id,
@@ -1,4 +1,5 @@
 from crawler.market.keywords import is_ai_candidate, normalize_for_match
+from crawler.textmatch import KeywordMatcher
 
 
 STRONG_UPDATE_KEYWORDS = [
@@ -70,6 +71,9 @@ SOFT_UPDATE_KEYWORDS = [
 ]
 
 
+UPDATE_MATCHER = KeywordMatcher(STRONG_UPDATE_KEYWORDS + SOFT_UPDATE_KEYWORDS)
+
+
 def is_updates_candidate(text):
     lowered = normalize_for_match(text)
     if not lowered:
@@ -79,6 +83,4 @@ def is_updates_candidate(text):
     if is_ai_candidate(lowered):
         return False
 
-    return any(keyword.lower() in lowered for keyword in STRONG_UPDATE_KEYWORDS) or any(
-        keyword.lower() in lowered for keyword in SOFT_UPDATE_KEYWORDS
-    )
+    return UPDATE_MATCHER.search(lowered)
@@ -3,6 +3,8 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from crawler.market.news_rss import canonical_news_id
+
 
 def load_json(path):
     if not path.exists():
@@ -18,7 +20,11 @@ def write_json(path, payload):
 def upsert_month_file(base_dir, month, events):
     month_path = Path(base_dir) / f"{month}.json"
     payload = load_json(month_path) or {"month": month, "events": []}
-    existing = {item.get("id"): item for item in payload.get("events", []) if item.get("id")}
+    existing = {}
+    for item in payload.get("events", []):
+        item_id = canonical_news_id(item.get("id"))
+        if item_id:
+            existing[item_id] = {**item, "id": item_id}
     for event in events:
         existing[event["id"]] = event
     merged = list(existing.values())
@@ -1,31 +1,74 @@
+from bisect import bisect_right
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 
 from ..config import HF_IMPORTANCE_PENALTY
-from ..utils import day_label, format_date, make_hash, normalize_text
+from ..utils import day_label, format_date, item_hash
 
 
 def filter_by_range(items, start, end):
     return [item for item in items if item.get("published_at") and start <= item["published_at"] <= end]
 
 
-def build_top_topics(items, limit=4):
-    counts = Counter()
-    scores = Counter()
+def topic_weight(item):
+    weight = item.get("importanceScore") or 1
+    if item.get("kind") == "huggingface" or item.get("source") == "Hugging Face Hub":
+        weight = max(1, weight - HF_IMPORTANCE_PENALTY)
+    return weight
+
+
+def aggregate_items(items, dates=False, weeks=None):
+    """Bucket items by topic (and publish date / week) in a single pass.
+
+    Returns {"count", "topics": {topic: [count, score]}} with topics in first
+    appearance order; dates=True adds "dates": {date: Counter of topics}, and
+    `weeks` (week_ranges output) adds "weeks": [Counter of topics] per range.
+    The weekly/monthly payloads are built from this instead of re-walking items.
+    """
+    topics = {}
+    per_day = defaultdict(Counter)
+    week_starts = [current for current, _week_end in weeks or ()]
+    week_counts = [Counter() for _ in week_starts]
+    count = 0
     for item in items:
-        weight = item.get("importanceScore") or 1
-        if item.get("kind") == "huggingface" or item.get("source") == "Hugging Face Hub":
-            weight = max(1, weight - HF_IMPORTANCE_PENALTY)
-        for topic in item.get("topics", []):
-            counts[topic] += 1
-            scores[topic] += weight
-    ranked = sorted(scores.items(), key=lambda x: (x[1], counts[x[0]]), reverse=True)
-    result = []
-    for topic, score in ranked[:limit]:
-        result.append((topic, counts[topic], score))
+        count += 1
+        item_topics = item.get("topics", [])
+        if not item_topics:
+            continue
+        weight = topic_weight(item)
+        for topic in item_topics:
+            entry = topics.get(topic)
+            if entry is None:
+                topics[topic] = [1, weight]
+            else:
+                entry[0] += 1
+                entry[1] += weight
+        if dates:
+            per_day[item["published_at"].toordinal()].update(item_topics)
+        if week_starts:
+            published = item["published_at"]
+            idx = bisect_right(week_starts, published) - 1
+            if idx >= 0 and published <= weeks[idx][1]:
+                week_counts[idx].update(item_topics)
+
+    result = {"count": count, "topics": topics}
+    if dates:
+        result["dates"] = {date.fromordinal(day).strftime("%Y-%m-%d"): counts for day, counts in per_day.items()}
+    if weeks is not None:
+        result["weeks"] = week_counts
     return result
 
 
+def rank_topics(topics, limit):
+    """(topic, count, score) by score then count; ties keep first appearance."""
+    ranked = sorted(topics.items(), key=lambda pair: (pair[1][1], pair[1][0]), reverse=True)
+    return [(topic, count, score) for topic, (count, score) in ranked[:limit]]
+
+
+def build_top_topics(items, limit=4):
+    return rank_topics(aggregate_items(items)["topics"], limit)
+
+
 def build_daily_summary(items, raw_count):
     if len(items) == 0:
         return {
@@ -57,55 +100,61 @@ def build_daily_summary(items, raw_count):
 def build_cards(items, tab="ai"):
     cards = []
     for idx, item in enumerate(items, start=1):
-        key = item.get("url") or item.get("title") or ""
-        signature = make_hash(normalize_text(key))
-        cards.append(
-            {
-                "id": f"{tab}_{idx:04d}",
-                "tab": item.get("tab", tab),
-                "publishedAt": item["published_at"].isoformat(),
-                "source": item.get("source"),
-                "title": item.get("title"),
-                "summary": item.get("summary", [])[:3],
-                "whyItMatters": item.get("why"),
-                "topics": item.get("topics", []),
-                "status": item.get("status"),
-                "hash": signature,
-                "url": item.get("url"),
-            }
-        )
+        signature = item_hash(item)
+        card = {
+            "id": f"{tab}_{idx:04d}",
+            "tab": item.get("tab", tab),
+            "publishedAt": item["published_at"].isoformat(),
+            "source": item.get("source"),
+            "title": item.get("title"),
+            "summary": item.get("summary", [])[:3],
+            "whyItMatters": item.get("why"),
+            "topics": item.get("topics", []),
+            "status": item.get("status"),
+            "hash": signature,
+            "url": item.get("url"),
+        }
+        if item.get("alternates"):
+            card["alternates"] = item["alternates"]
+        cards.append(card)
     return cards
 
 
-def build_topic_trend(items, start, end, top_topics):
-    topic_names = [topic for topic, _count, _score in top_topics]
-    per_day = defaultdict(lambda: Counter())
+def trend_dates(start, end):
+    dates = []
     current = start
     while current <= end:
-        per_day[format_date(current)]
+        dates.append(format_date(current))
         current += timedelta(days=1)
+    return dates
 
-    for item in items:
-        date_key = format_date(item["published_at"])
-        for topic in item.get("topics", []):
-            if topic in topic_names:
-                per_day[date_key][topic] += 1
 
+def topic_trend(per_day, start, end, topic_names):
+    date_keys = set(trend_dates(start, end))
+    for date_key, counts in per_day.items():
+        if any(counts.get(topic) for topic in topic_names):
+            date_keys.add(date_key)
     trend = []
-    for date_key in sorted(per_day.keys()):
-        day_topics = per_day[date_key]
+    for date_key in sorted(date_keys):
+        counts = per_day.get(date_key) or {}
+        day_of_week = day_label(date.fromisoformat(date_key))
         for topic in topic_names:
             trend.append(
                 {
                     "date": date_key,
-                    "dayOfWeek": day_label(datetime.strptime(date_key, "%Y-%m-%d")),
+                    "dayOfWeek": day_of_week,
                     "topic": topic,
-                    "count": day_topics.get(topic, 0),
+                    "count": counts.get(topic, 0),
                 }
             )
     return trend
 
 
+def build_topic_trend(items, start, end, top_topics):
+    topic_names = [topic for topic, _count, _score in top_topics]
+    return topic_trend(aggregate_items(items, dates=True)["dates"], start, end, topic_names)
+
+
 def build_top_issues(top_topics):
     issues = []
     for idx, (topic, count, _score) in enumerate(top_topics[:4], start=1):
@@ -122,8 +171,10 @@ def build_top_issues(top_topics):
     return issues
 
 
-def build_weekly_data(items, raw_count, start, end, issues=None):
-    top_topics = build_top_topics(items, limit=4)
+def weekly_payload(totals, raw_count, start, end, issues=None):
+    """Weekly payload from aggregate_items(..., dates=True) totals."""
+    top_topics = rank_topics(totals["topics"], 4)
+    topic_names = [topic for topic, _count, _score in top_topics]
     return {
         "range": {
             "from": format_date(start),
@@ -131,52 +182,65 @@ def build_weekly_data(items, raw_count, start, end, issues=None):
         },
         "kpis": {
             "collected": raw_count,
-            "deduped": len(items),
-            "uniqueTopics": len({topic for item in items for topic in item.get("topics", [])}),
+            "deduped": totals["count"],
+            "uniqueTopics": len(totals["topics"]),
         },
         "topTopics": [{"name": topic, "count": count} for topic, count, _score in top_topics],
-        "topicTrend": build_topic_trend(items, start, end, top_topics),
+        "topicTrend": topic_trend(totals["dates"], start, end, topic_names),
         "topIssues": issues or build_top_issues(top_topics),
     }
 
 
-def build_weekly_breakdown(items, start, end, top_topics):
-    topic_names = [topic for topic, _count, _score in top_topics]
-    weekly = []
+def build_weekly_data(items, raw_count, start, end, issues=None):
+    return weekly_payload(aggregate_items(items, dates=True), raw_count, start, end, issues)
+
+
+def week_ranges(start, end):
+    # 7-day steps, each bucket closed at +6 days; items published in the last
+    # day of a step fall between buckets.
+    ranges = []
     current = start
     while current <= end:
-        week_end = min(current + timedelta(days=6), end)
-        label = f"Week {len(weekly) + 1} ({current.strftime('%m/%d')}-{week_end.strftime('%m/%d')})"
-        counts = Counter()
-        for item in items:
-            if current <= item["published_at"] <= week_end:
-                for topic in item.get("topics", []):
-                    if topic in topic_names:
-                        counts[topic] += 1
+        ranges.append((current, min(current + timedelta(days=6), end)))
+        current += timedelta(days=7)
+    return ranges
+
+
+def week_label(number, current, week_end):
+    return f"Week {number} ({current.strftime('%m/%d')}-{week_end.strftime('%m/%d')})"
+
+
+def weekly_breakdown(ranges, week_counts, topic_names):
+    weekly = []
+    for (current, week_end), counts in zip(ranges, week_counts):
         weekly.append(
             {
-                "week": label,
+                "week": week_label(len(weekly) + 1, current, week_end),
                 "topicCounts": {topic: counts.get(topic, 0) for topic in topic_names},
             }
         )
-        current += timedelta(days=7)
     return weekly
 
 
-def build_monthly_data(items, raw_count, start, end, issues=None):
-    top_topics = build_top_topics(items, limit=5)
+def build_weekly_breakdown(items, start, end, top_topics):
     topic_names = [topic for topic, _count, _score in top_topics]
-    counts = Counter()
-    for item in items:
-        for topic in item.get("topics", []):
-            if topic in topic_names:
-                counts[topic] += 1
+    ranges = week_ranges(start, end)
+    return weekly_breakdown(ranges, aggregate_items(items, weeks=ranges)["weeks"], topic_names)
+
 
+def build_market_share(counts, topic_names):
     total = sum(counts.values()) or 1
     market_share = {topic: round(counts.get(topic, 0) / total * 100) for topic in topic_names}
     other = max(0, 100 - sum(market_share.values()))
     market_share["Other"] = other
+    return market_share
 
+
+def monthly_payload(totals, raw_count, start, end, ranges, issues=None):
+    """Monthly payload from aggregate_items(..., weeks=ranges) totals."""
+    top_topics = rank_topics(totals["topics"], 5)
+    topic_names = [topic for topic, _count, _score in top_topics]
+    counts = {topic: count for topic, count, _score in top_topics}
     return {
         "range": {
             "from": format_date(start),
@@ -184,10 +248,16 @@ def build_monthly_data(items, raw_count, start, end, issues=None):
         },
         "kpis": {
             "collected": raw_count,
-            "deduped": len(items),
-            "uniqueTopics": len({topic for item in items for topic in item.get("topics", [])}),
-            "marketShare": market_share,
+            "deduped": totals["count"],
+            "uniqueTopics": len(totals["topics"]),
+            "marketShare": build_market_share(counts, topic_names),
         },
-        "weeklyData": build_weekly_breakdown(items, start, end, top_topics),
+        "weeklyData": weekly_breakdown(ranges, totals["weeks"], topic_names),
         "topIssues": issues or build_top_issues(top_topics),
     }
+
+
+def build_monthly_data(items, raw_count, start, end, issues=None):
+    ranges = week_ranges(start, end)
+    totals = aggregate_items(items, weeks=ranges)
+    return monthly_payload(totals, raw_count, start, end, ranges, issues)
@@ -1,16 +1,150 @@
-from ..utils import make_hash, normalize_text
+import html
+import re
+from collections import defaultdict
 
+from ..config import NEAR_DUP_KINDS, NEAR_DUP_MIN_CHARS, NEAR_DUP_THRESHOLD
+from ..utils import item_hash
 
-def dedupe_items(items):
+
+# Near-duplicate stage: character 3-gram shingles of title + snippet go through a
+# one-permutation MinHash (one hash per shingle, SIGNATURE_BINS bins) and banded
+# LSH, so only items sharing a band bucket are compared; candidates are then
+# confirmed with exact Jaccard similarity. Cost grows with total text, not pairs.
+SHINGLE_SIZE = 3
+SHINGLE_TEXT_CHARS = 600
+SIGNATURE_BINS = 48
+BAND_ROWS = 3
+
+_MIX_PRIME = (1 << 61) - 1
+_MIX_MULT = 0x5BD1E9955BD1E995 % _MIX_PRIME
+_MIX_ADD = 0x27D4EB2F165667C5 % _MIX_PRIME
+_EMPTY = 1 << 62
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def _shingle_text(item):
+    text = f"{item.get('title') or ''} {item.get('snippet') or ''}"
+    text = _TAG_RE.sub(" ", html.unescape(text)).lower()
+    return _NON_WORD_RE.sub(" ", text).strip()[:SHINGLE_TEXT_CHARS]
+
+
+def _shingles(text):
+    # Code points packed into one int per 3-gram: deterministic across runs,
+    # unlike str hashing.
+    codes = [ord(char) for char in text]
+    return {(a << 42) | (b << 21) | c for a, b, c in zip(codes, codes[1:], codes[2:])}
+
+
+def _signature(shingles):
+    mins = [_EMPTY] * SIGNATURE_BINS
+    for shingle in shingles:
+        mixed = (shingle * _MIX_MULT + _MIX_ADD) % _MIX_PRIME
+        slot, value = divmod(mixed, _MIX_PRIME // SIGNATURE_BINS + 1)
+        if value < mins[slot]:
+            mins[slot] = value
+    # Densify empty bins from the next filled one so short texts still band.
+    filled = [idx for idx, value in enumerate(mins) if value != _EMPTY]
+    if not filled:
+        return mins
+    for idx in range(SIGNATURE_BINS):
+        if mins[idx] == _EMPTY:
+            source = next((pos for pos in filled if pos > idx), filled[0])
+            mins[idx] = mins[source] + (source - idx) % SIGNATURE_BINS
+    return mins
+
+
+def _jaccard(left, right):
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def _representative_key(item):
+    published = item.get("published_at")
+    return (
+        bool(item.get("url")),
+        len(item.get("snippet") or ""),
+        -published.timestamp() if published else float("-inf"),
+    )
+
+
+def near_duplicate_clusters(items, threshold=None):
+    """Group near-duplicate items (same tab only); returns lists of indexes.
+
+    Every index appears in exactly one cluster, clusters in input order.
+    """
+    threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+    parent = list(range(len(items)))
+
+    def find(idx):
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    shingle_sets = {}
+    buckets = defaultdict(list)
+    for idx, item in enumerate(items):
+        if item.get("kind") not in NEAR_DUP_KINDS:
+            continue
+        text = _shingle_text(item)
+        if len(text) < NEAR_DUP_MIN_CHARS:
+            continue
+        shingles = _shingles(text)
+        shingle_sets[idx] = shingles
+        signature = _signature(shingles)
+        tab = item.get("tab", "ai")
+        for band in range(0, SIGNATURE_BINS, BAND_ROWS):
+            bucket = buckets[(tab, band, tuple(signature[band : band + BAND_ROWS]))]
+            for other in bucket:
+                if find(other) != find(idx) and _jaccard(shingles, shingle_sets[other]) >= threshold:
+                    parent[find(idx)] = find(other)
+            bucket.append(idx)
+
+    clusters = defaultdict(list)
+    for idx in range(len(items)):
+        clusters[find(idx)].append(idx)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def _collapse_near_duplicates(items, stats=None):
+    collapsed = []
+    removed = 0
+    for members in near_duplicate_clusters(items):
+        if len(members) == 1:
+            collapsed.append(items[members[0]])
+            continue
+        best = max(members, key=lambda idx: (_representative_key(items[idx]), -idx))
+        alternates = [
+            {
+                "source": items[idx].get("source"),
+                "title": items[idx].get("title"),
+                "url": items[idx].get("url"),
+            }
+            for idx in members
+            if idx != best
+        ]
+        collapsed.append({**items[best], "alternates": alternates})
+        removed += len(alternates)
+    if stats is not None:
+        stats["nearDuplicates"] = removed
+    return collapsed
+
+
+def dedupe_items(items, stats=None, near_duplicates=True):
     seen = set()
     deduped = []
     for item in items:
-        key = item.get("url") or item.get("title")
-        if not key:
+        if not (item.get("url") or item.get("title")):
             continue
-        signature = make_hash(normalize_text(key))
+        signature = item_hash(item)
         if signature in seen:
             continue
         seen.add(signature)
         deduped.append(item)
-    return deduped
+    if not near_duplicates:
+        return deduped
+    return _collapse_near_duplicates(deduped, stats=stats)
@@ -0,0 +1,406 @@
+import html
+import re
+
+from ..textmatch import KeywordMatcher
+
+
+# Keyword prefilters for noisy RSS tabs, applied before dedupe/LLM. Rules are
+# declarative (PREFILTER_RULES) and compiled once at import; each item's snippet
+# is cleaned once no matter how many clauses look at it.
+
+# Strong prefilter for korea.kr policy RSS in finance tab.
+FINANCE_POLICY_ANCHORS = [
+    "금융위",
+    "금융위원회",
+    "금감원",
+    "금융감독원",
+
+    "은행",
+    "대출",
+    "예금",
+    "가계부채",
+    "금리",
+    "부동산PF",
+    "금융권",
+    "보험사",
+    "보험회사",
+    "보험업",
+    "보험료",
+    "보험금",
+    "증권",
+    "자본시장",
+    "금융지원",
+    "금융정책",
+    "자본시장법",
+    "공매도",
+    "불공정거래",
+    "주가조작",
+    "시장조성",
+    "파생",
+    "파생상품",
+    "공시",
+    "상장",
+    "회계",
+    "감리",
+    "불완전판매",
+
+    "전자금융",
+    "핀테크",
+    "오픈뱅킹",
+    "마이데이터",
+    "간편결제",
+    "결제",
+    "송금",
+
+    "가상자산",
+    "디지털자산",
+    "스테이블코인",
+    "STO",
+    "대체거래소",
+    "거래소",
+    "예탁결제원",
+    "자금세탁",
+    "AML",
+    "이상거래",
+    "FDS",
+    "내부통제",
+
+    "개인정보",
+    "개인정보보호",
+    "유출",
+    "해킹",
+    "피싱",
+    "스미싱",
+    "보이스피싱",
+    "취약점",
+    "보안",
+    "본인인증",
+    "인증서",
+    "전자서명",
+    "인증수단",
+    "인증체계",
+    "금융보안",
+]
+
+
+FINANCE_POLICY_QUALIFIERS = [
+    "감독",
+    "규제",
+    "지침",
+    "가이드",
+    "가이드라인",
+    "입법",
+    "법안",
+    "시행령",
+    "제도",
+    "개정",
+    "정비",
+    "대책",
+    "방안",
+    "발표",
+    "시행",
+    "추진",
+    "강화",
+    "제재",
+    "과징금",
+    "과태료",
+    "행정처분",
+]
+
+
+FINANCE_POLICY_ALWAYS = [
+    # These are usually finance/reg/security even without explicit policy verbs.
+    "마이데이터",
+    "오픈뱅킹",
+    "전자금융",
+    "금융보안",
+    "가상자산",
+    "디지털자산",
+    "스테이블코인",
+    "STO",
+    "자금세탁",
+    "AML",
+    "FDS",
+    "이상거래",
+    "개인정보",
+    "유출",
+    "해킹",
+    "피싱",
+    "스미싱",
+    "보이스피싱",
+    "취약점",
+]
+
+
+REALESTATE_ANCHORS = [
+    "부동산",
+    "주택",
+    "아파트",
+    "집값",
+    "가격",
+    "거래",
+    "매매",
+    "청약",
+    "분양",
+    "임대",
+    "전세",
+    "월세",
+    "전월세",
+    "전세값",
+    "월세값",
+    "임대차",
+    "재건축",
+    "재개발",
+    "정비사업",
+    "공급",
+    "택지",
+    "공시가격",
+    "공시지가",
+    "주담대",
+    "주택담보",
+    "LTV",
+    "DTI",
+    "DSR",
+    "취득세",
+    "양도세",
+    "종부세",
+    "재산세",
+    "PF",
+    "미분양",
+]
+
+
+REALESTATE_POLICY_SIGNALS = [
+    "정책",
+    "대책",
+    "규제",
+    "완화",
+    "강화",
+    "지원",
+    "시행",
+    "개정",
+    "입법",
+    "법안",
+    "고시",
+    "공고",
+    "가이드",
+    "방안",
+    "발표",
+    "계획",
+    "시정",
+    "억제",
+    "안정",
+    "안정화",
+    "관리",
+    "단속",
+    "점검",
+    "대응",
+    "조치",
+    "개선",
+    "방침",
+    "지시",
+    "당정",
+    "정부",
+    "대통령실",
+    "국회",
+    "투기",
+    "과열",
+    "검토",
+    "추진",
+    "논의",
+    "협의",
+    "TF",
+    "시범",
+    "관계부처",
+    "국토교통부",
+    "국토부",
+    "LH",
+    "주택도시기금",
+]
+
+
+REALESTATE_SOFT_SIGNALS = [
+    "매물",
+    "공급",
+    "양도세",
+    "임대사업자",
+    "등록임대",
+    "다주택",
+    "1주택",
+    "실거주",
+    "유예",
+    "세제",
+    "세금",
+    "취득세",
+    "종부세",
+    "재산세",
+    "전월세",
+    "전세",
+    "월세",
+    "매도",
+    "매수",
+]
+
+
+REALESTATE_MEDIA_EXCLUDES = [
+    "매물마당",
+    "분양캘린더",
+    "시세",
+    "급매",
+    "신고가",
+    "청약경쟁률",
+    "수주",
+    "실적",
+]
+
+
+# Rules are tried in order; the first whose tab (and sources, when given) match an
+# RSS item decides it. `reject` clauses drop the item, then the item is kept if
+# any `accept` clause holds. A clause is a list of (field, keywords) conditions
+# that must all match; fields are "title" or "text" (title + cleaned snippet).
+PREFILTER_RULES = [
+    {
+        "name": "finance_policy",
+        "tab": "finance",
+        "sources": ["정책브리핑"],
+        "reject": [],
+        "accept": [
+            ("anchor_in_title", [("title", FINANCE_POLICY_ANCHORS)]),
+            ("always", [("text", FINANCE_POLICY_ALWAYS)]),
+            ("anchor_and_qualifier", [("text", FINANCE_POLICY_ANCHORS), ("text", FINANCE_POLICY_QUALIFIERS)]),
+        ],
+    },
+    {
+        "name": "realestate_media",
+        "tab": "realestate",
+        "sources": ["한국경제(부동산)", "매일경제(부동산)", "헤럴드경제(부동산)"],
+        "reject": [
+            ("media_exclude_in_title", [("title", REALESTATE_MEDIA_EXCLUDES)]),
+        ],
+        "accept": [
+            ("anchor_and_signal", [("text", REALESTATE_ANCHORS), ("text", REALESTATE_POLICY_SIGNALS)]),
+            ("anchor_and_soft_signal_in_title", [("title", REALESTATE_ANCHORS), ("title", REALESTATE_SOFT_SIGNALS)]),
+        ],
+    },
+    {
+        "name": "realestate_policy",
+        "tab": "realestate",
+        "sources": None,
+        "reject": [],
+        "accept": [
+            ("anchor_and_signal", [("text", REALESTATE_ANCHORS), ("text", REALESTATE_POLICY_SIGNALS)]),
+        ],
+    },
+]
+
+# korea.kr policy RSS often includes a long ministry contact footer ("문의:"),
+# which can create false positives (e.g. unrelated policies listing 금융위원회).
+CUT_MARKERS = (
+    "문의:",
+    "문의 :",
+    "문의처",
+    "문의사항:",
+    "담당부서",
+    "첨부파일",
+    "자료출처",
+    "관련자료",
+)
+SNIPPET_BODY_CHARS = 800
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_CUT_RE = re.compile("|".join(re.escape(marker) for marker in CUT_MARKERS))
+
+
+def _compile_rules(rules):
+    matchers = {}
+
+    def compile_clause(conditions):
+        compiled = []
+        for field, keywords in conditions:
+            if id(keywords) not in matchers:
+                matchers[id(keywords)] = KeywordMatcher(keywords)
+            compiled.append((field, matchers[id(keywords)]))
+        return compiled
+
+    return [
+        {
+            "name": rule["name"],
+            "tab": rule["tab"],
+            "sources": set(rule["sources"]) if rule.get("sources") else None,
+            "reject": [(name, compile_clause(clause)) for name, clause in rule.get("reject") or []],
+            "accept": [(name, compile_clause(clause)) for name, clause in rule.get("accept") or []],
+        }
+        for rule in rules
+    ]
+
+
+_COMPILED_RULES = _compile_rules(PREFILTER_RULES)
+
+
+def clean_snippet(snippet):
+    # Strip HTML (korea.kr snippets are HTML-heavy) and the contact footer.
+    text = html.unescape(snippet or "")
+    text = " ".join(_TAG_RE.sub(" ", text).split())
+    cut = _CUT_RE.search(text)
+    if cut:
+        text = text[: cut.start()]
+    return text[:SNIPPET_BODY_CHARS]
+
+
+def _rule_for(item):
+    if item.get("kind") != "rss":
+        return None
+    tab = item.get("tab")
+    source = item.get("source") or ""
+    for rule in _COMPILED_RULES:
+        if rule["tab"] == tab and (rule["sources"] is None or source in rule["sources"]):
+            return rule
+    return None
+
+
+def _first_clause(clauses, fields):
+    for name, conditions in clauses:
+        if all(matcher.search(fields[field]) for field, matcher in conditions):
+            return name
+    return None
+
+
+def apply_prefilters(items, stats=None):
+    """Drop RSS items that fail their tab's prefilter rule; others pass through.
+
+    If `stats` is a dict it receives, per rule, checked/kept counts and how many
+    items each clause decided (items matching no accept clause count as
+    "noMatch").
+    """
+    kept = []
+    counters = {}
+    for item in items:
+        rule = _rule_for(item)
+        if rule is None:
+            kept.append(item)
+            continue
+
+        title = item.get("title") or ""
+        fields = {
+            "title": title.lower(),
+            "text": f"{title} {clean_snippet(item.get('snippet'))}".lower(),
+        }
+        counter = counters.setdefault(rule["name"], {"checked": 0, "kept": 0, "clauses": {}})
+        counter["checked"] += 1
+
+        decided = _first_clause(rule["reject"], fields)
+        accepted = False
+        if decided is None:
+            decided = _first_clause(rule["accept"], fields)
+            accepted = decided is not None
+        decided = decided or "noMatch"
+        counter["clauses"][decided] = counter["clauses"].get(decided, 0) + 1
+        if accepted:
+            counter["kept"] += 1
+            kept.append(item)
+
+    for name, counter in counters.items():
+        print(f"[prefilter] {name} kept: {counter['kept']}/{counter['checked']}")
+    if stats is not None:
+        stats.update(counters)
+    return kept
@@ -0,0 +1,148 @@
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+
+from ..utils import epoch_us, format_date
+from .aggregate import monthly_payload, topic_weight, week_ranges, weekly_payload
+
+
+# Incremental weekly/monthly rollups. Every archived day keeps a partial
+# aggregate (per-topic count, importance-weighted score and first-appearance
+# key, plus per-publish-date topic counts) next to its cards in the archive
+# index. A window merges the partials of its days; days that cross the window
+# edge or a weekly bucket edge are recomputed from their cards. The payloads
+# match build_weekly_data / build_monthly_data over the same items.
+#
+# build_top_topics breaks (score, count) ties by first appearance in
+# sort_by_importance order, i.e. by the largest
+# (importanceScore or 0, published_at, -day, -card position, -topic position).
+
+
+def day_partial(items):
+    """Aggregate one archived day's items, given in card order."""
+    topics = {}
+    dates = {}
+    stamps = []
+    for pos, item in enumerate(items):
+        ts = epoch_us(item["published_at"])
+        stamps.append(ts)
+        weight = topic_weight(item)
+        date_key = format_date(item["published_at"])
+        for topic_pos, topic in enumerate(item.get("topics", [])):
+            key = [item.get("importanceScore") or 0, ts, -pos, -topic_pos]
+            entry = topics.get(topic)
+            if entry is None:
+                topics[topic] = [1, weight, key]
+            else:
+                entry[0] += 1
+                entry[1] += weight
+                entry[2] = max(entry[2], key)
+            day_counts = dates.setdefault(date_key, {})
+            day_counts[topic] = day_counts.get(topic, 0) + 1
+    return {
+        "count": len(items),
+        "minUs": min(stamps) if stamps else None,
+        "maxUs": max(stamps) if stamps else None,
+        "topics": topics,
+        "dates": dates,
+    }
+
+
+class _Window:
+    def __init__(self, start, end, buckets=None):
+        self.start_us = epoch_us(start)
+        self.end_us = epoch_us(end)
+        self.count = 0
+        self.topics = {}
+        self.dates = {}
+        self.buckets = None
+        if buckets is not None:
+            self.bucket_starts = [epoch_us(lo) for lo, _hi in buckets]
+            self.bucket_ends = [epoch_us(hi) for _lo, hi in buckets]
+            self.buckets = [Counter() for _ in buckets]
+
+    def _bucket(self, ts):
+        idx = bisect_right(self.bucket_starts, ts) - 1
+        if idx >= 0 and ts <= self.bucket_ends[idx]:
+            return idx
+        return None
+
+    def _merge(self, day_ord, partial, bucket=None):
+        self.count += partial["count"]
+        for topic, (count, score, key) in partial["topics"].items():
+            full_key = (key[0], key[1], -day_ord, key[2], key[3])
+            entry = self.topics.get(topic)
+            if entry is None:
+                self.topics[topic] = [count, score, full_key]
+            else:
+                entry[0] += count
+                entry[1] += score
+                entry[2] = max(entry[2], full_key)
+            if bucket is not None:
+                self.buckets[bucket][topic] += count
+        for date_key, counts in partial["dates"].items():
+            self.dates.setdefault(date_key, Counter()).update(counts)
+
+    def add_day(self, day, partial, load_items):
+        if not partial["count"] or partial["maxUs"] < self.start_us or partial["minUs"] > self.end_us:
+            return
+        day_ord = date.fromisoformat(day).toordinal()
+        inside = self.start_us <= partial["minUs"] and partial["maxUs"] <= self.end_us
+        if inside and self.buckets is None:
+            self._merge(day_ord, partial)
+            return
+        if inside:
+            first = self._bucket(partial["minUs"])
+            last = self._bucket(partial["maxUs"])
+            same_step = bisect_right(self.bucket_starts, partial["minUs"]) == bisect_right(
+                self.bucket_starts, partial["maxUs"]
+            )
+            if same_step and first == last:
+                self._merge(day_ord, partial, bucket=first)
+                return
+
+        # Edge day: recompute from the cards that fall inside the window.
+        items = [
+            item
+            for item in load_items()
+            if self.start_us <= epoch_us(item["published_at"]) <= self.end_us
+        ]
+        self._merge(day_ord, day_partial(items))
+        if self.buckets is not None:
+            for item in items:
+                bucket = self._bucket(epoch_us(item["published_at"]))
+                if bucket is not None:
+                    self.buckets[bucket].update(item.get("topics", []))
+
+    def totals(self):
+        # aggregate_items() shape, topics in first-appearance order so that
+        # rank_topics breaks (score, count) ties like build_top_topics.
+        ordered = sorted(self.topics.items(), key=lambda pair: pair[1][2], reverse=True)
+        totals = {
+            "count": self.count,
+            "topics": {topic: [count, score] for topic, (count, score, _key) in ordered},
+            "dates": self.dates,
+        }
+        if self.buckets is not None:
+            totals["weeks"] = self.buckets
+        return totals
+
+
+def _collect(days, start, end, buckets=None):
+    window = _Window(start, end, buckets)
+    for day, partial, load_items in days:
+        window.add_day(day, partial, load_items)
+    return window
+
+
+def build_weekly_rollup(days, raw_count, start, end, issues=None):
+    """build_weekly_data from archive day partials (archive_index.load_rollup_days)."""
+    totals = _collect(days, start, end).totals()
+    return weekly_payload(totals, raw_count, start, end, issues)
+
+
+def build_monthly_rollup(days, raw_count, start, end, issues=None):
+    """build_monthly_data from archive day partials (archive_index.load_rollup_days)."""
+    ranges = week_ranges(start, end)
+    totals = _collect(days, start, end, buckets=ranges).totals()
+    return monthly_payload(totals, raw_count, start, end, ranges, issues)
@@ -0,0 +1,100 @@
+import json
+import sqlite3
+import time
+
+from ..config import SEEN_INDEX_PATH, SEEN_INDEX_TTL_DAYS
+from ..llm.cache import PROMPT_VERSIONS
+from ..utils import item_hash, normalize_text, sha1_text
+
+
+# Cross-run index of enriched industry items, keyed by (canonical item hash,
+# tab). An item whose title/snippet fingerprint and item prompt version still
+# match is carried over with its stored fields instead of being summarized again.
+ENRICHED_FIELDS = ("summary", "why", "topics", "status", "importanceScore")
+
+# Bump when stored rows must not be reused; the index is rebuilt. Version 1
+# drops rows recorded before fallback summaries were kept out of the index.
+SCHEMA_VERSION = 1
+
+
+def _connect():
+    SEEN_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(SEEN_INDEX_PATH), isolation_level=None)
+    (version,) = conn.execute("PRAGMA user_version").fetchone()
+    if version != SCHEMA_VERSION:
+        conn.execute("DROP TABLE IF EXISTS items")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS items ("
+        "hash TEXT NOT NULL, tab TEXT NOT NULL, content TEXT NOT NULL, "
+        "version INTEGER NOT NULL, first_seen REAL NOT NULL, last_seen REAL NOT NULL, "
+        "value TEXT NOT NULL, PRIMARY KEY (hash, tab))"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS items_last_seen ON items (last_seen)")
+    return conn
+
+
+def _content(item):
+    return sha1_text(f"{normalize_text(item.get('title'))}\n{normalize_text(item.get('snippet'))}")
+
+
+def _key(item):
+    return item_hash(item), item.get("tab", "ai")
+
+
+def lookup_many(items):
+    """Stored enriched fields for items seen before, as {index: fields}."""
+    if not items:
+        return {}
+    now = time.time()
+    version = PROMPT_VERSIONS.get("item", 0)
+    found = {}
+    try:
+        conn = _connect()
+        try:
+            for idx, item in enumerate(items):
+                row = conn.execute(
+                    "SELECT content, version, value FROM items WHERE hash = ? AND tab = ?",
+                    _key(item),
+                ).fetchone()
+                if row and row[0] == _content(item) and row[1] == version:
+                    found[idx] = json.loads(row[2])
+            conn.executemany(
+                "UPDATE items SET last_seen = ? WHERE hash = ? AND tab = ?",
+                [(now, *_key(items[idx])) for idx in found],
+            )
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        print(f"[seen] lookup failed: {exc}")
+        return {}
+    return found
+
+
+def store_many(items):
+    """Record enriched items; drops entries unseen for SEEN_INDEX_TTL_DAYS."""
+    now = time.time()
+    version = PROMPT_VERSIONS.get("item", 0)
+    rows = []
+    for item in items:
+        value = {field: item.get(field) for field in ENRICHED_FIELDS}
+        rows.append((*_key(item), _content(item), version, now, now, json.dumps(value, ensure_ascii=False)))
+    try:
+        conn = _connect()
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT INTO items (hash, tab, content, version, first_seen, last_seen, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (hash, tab) DO UPDATE SET content = excluded.content, "
+                "version = excluded.version, last_seen = excluded.last_seen, value = excluded.value",
+                rows,
+            )
+            conn.execute(
+                "DELETE FROM items WHERE last_seen < ?", (now - SEEN_INDEX_TTL_DAYS * 86400,)
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+    except sqlite3.Error as exc:
+        print(f"[seen] store failed: {exc}")
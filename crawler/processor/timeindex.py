@@ -0,0 +1,59 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+
+def sort_by_importance(items):
+    return sorted(
+        items,
+        key=lambda item: (
+            item.get("importanceScore") or 0,
+            item.get("published_at") or datetime.min,
+        ),
+        reverse=True,
+    )
+
+
+class TimeIndex:
+    """Dated items sorted once by published_at.
+
+    between() answers filter_by_range by bisection and ranked() returns
+    sort_by_importance(filter_by_range(...)) for a window, cached per window.
+    The items are sorted oldest first from the reversed input, so a window read
+    backwards is newest first with equal timestamps in input order; a stable
+    sort on importanceScore alone then gives sort_by_importance's order.
+    """
+
+    def __init__(self, items):
+        dated = [item for item in items if item.get("published_at")]
+        self.items = sorted(reversed(dated), key=lambda item: item["published_at"])
+        self._stamps = [item["published_at"] for item in self.items]
+        self._ranked = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def _bounds(self, start, end):
+        return bisect_left(self._stamps, start), bisect_right(self._stamps, end)
+
+    def between(self, start, end):
+        """Items published within [start, end], newest first."""
+        lo, hi = self._bounds(start, end)
+        return self.items[lo:hi][::-1]
+
+    def count(self, start, end):
+        lo, hi = self._bounds(start, end)
+        return max(0, hi - lo)
+
+    def ranked(self, start, end):
+        """Items published within [start, end] in sort_by_importance order
+        (a cached list shared between calls; do not mutate it).
+        """
+        cached = self._ranked.get((start, end))
+        if cached is None:
+            cached = sorted(
+                self.between(start, end),
+                key=lambda item: item.get("importanceScore") or 0,
+                reverse=True,
+            )
+            self._ranked[(start, end)] = cached
+        return cached
@@ -0,0 +1,51 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket refilled at `per_minute` units per minute.
+
+    Callers block in acquire() until enough budget is available. sync() lets a
+    caller tighten the bucket from server-reported remaining quota, and pause()
+    stops every caller for a while (e.g. after a 429).
+    """
+
+    def __init__(self, per_minute, burst=None):
+        self.rate = max(per_minute, 1) / 60.0
+        self.capacity = float(burst or max(per_minute, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, amount=1):
+        amount = min(float(amount), self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= amount:
+                        self._tokens -= amount
+                        return
+                    wait = (amount - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def sync(self, remaining, reset_seconds=None):
+        with self._lock:
+            self._refill(time.monotonic())
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+        if remaining is not None and remaining <= 0 and reset_seconds:
+            self.pause(reset_seconds)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
@@ -0,0 +1,102 @@
+import re
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed keyword set.
+
+    `keywords` is a {keyword: label} dict, a list of keywords (each its own
+    label) or a list of (keyword, label) pairs. Keywords are lowercased once and
+    compiled into a single trie-shaped regex, so finding every keyword in a text
+    is one C-level scan instead of one `in` test per keyword. Overlapping and
+    nested keywords are all reported. With case_sensitive=True neither side is
+    lowercased.
+    """
+
+    def __init__(self, keywords, case_sensitive=False):
+        self.case_sensitive = case_sensitive
+        if isinstance(keywords, dict):
+            pairs = keywords.items()
+        else:
+            pairs = [(entry, entry) if isinstance(entry, str) else entry for entry in keywords]
+        self.entries = []
+        self._starts = {}
+        trie = {}
+        for keyword, label in pairs:
+            lowered = (keyword or "") if case_sensitive else (keyword or "").lower()
+            if not lowered:
+                continue
+            index = len(self.entries)
+            self.entries.append((lowered, label))
+            self._starts.setdefault(lowered[0], []).append((index, lowered))
+            node = trie
+            for char in lowered:
+                node = node.setdefault(char, {})
+            node[""] = True
+        self._pattern = re.compile(_trie_pattern(trie) or "(?!)")
+
+    def search(self, text):
+        """True if any keyword occurs in text."""
+        return bool(text) and self._pattern.search(self._fold(text)) is not None
+
+    def _fold(self, text):
+        return text if self.case_sensitive else text.lower()
+
+    def hits(self, text):
+        """Indexes (into self.entries) of every keyword occurring in text, sorted."""
+        if not text:
+            return []
+        lowered = self._fold(text)
+        found = set()
+        search = self._pattern.search
+        pos = 0
+        while True:
+            match = search(lowered, pos)
+            if match is None:
+                break
+            start = match.start()
+            for index, keyword in self._starts[lowered[start]]:
+                if lowered.startswith(keyword, start):
+                    found.add(index)
+            pos = start + 1
+        return sorted(found)
+
+    def labels(self, text):
+        """Distinct labels of matching keywords, in keyword order."""
+        labels = []
+        for index in self.hits(text):
+            label = self.entries[index][1]
+            if label not in labels:
+                labels.append(label)
+        return labels
+
+    def first(self, text):
+        """Label of the earliest-listed keyword occurring in text, or None."""
+        hits = self.hits(text)
+        return self.entries[hits[0]][1] if hits else None
+
+
+def _trie_pattern(node):
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        body = f"(?:{body})?"
+    return body
+
+
+_compiled = {}
+
+
+def compiled(keywords, case_sensitive=False):
+    """Shared KeywordMatcher for a module-level keyword table."""
+    key = (id(keywords), case_sensitive)
+    cached = _compiled.get(key)
+    if cached is None or cached[0] is not keywords:
+        cached = (keywords, KeywordMatcher(keywords, case_sensitive=case_sensitive))
+        _compiled[key] = cached
+    return cached[1]
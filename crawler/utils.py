@@ -1,25 +1,76 @@
 import hashlib
 import re
-from datetime import datetime
+from datetime import datetime, timedelta, timezone as dt_timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from time import struct_time
+from urllib.parse import parse_qsl, urlencode, urlsplit
 from zoneinfo import ZoneInfo
 
 from dateutil import parser
 
+from .config import URL_HOST_RULES, URL_TRACKING_PARAMS
+
+
+# Fast paths for the formats feeds and the archive actually use; anything else
+# (or anything they reject) goes through dateutil. RFC-822 dates take the fast
+# path only with 4-digit years and numeric/GMT/UTC zones, where email.utils and
+# dateutil agree (named zones such as EST and "-0000" are read differently).
+_ISO_DATETIME = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+_RFC822_DATETIME = re.compile(
+    r"(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s*)?\d{1,2} [A-Za-z]{3} \d{4} \d{1,2}:\d{2}(?::\d{2})? (?-i:[+-]\d{4}|GMT|UTC)",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=None)
+def _zone(timezone):
+    return ZoneInfo(timezone)
+
+
+def _parse_text(value):
+    text = value.strip()
+    try:
+        if _ISO_DATETIME.fullmatch(text):
+            return datetime.fromisoformat(text)
+        if _RFC822_DATETIME.fullmatch(text) and not text.endswith("-0000"):
+            return parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        pass
+    return parser.parse(text)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(value, timezone):
+    try:
+        dt = _parse_text(value)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_zone(timezone))
+    return dt.astimezone(_zone(timezone))
+
 
 def parse_datetime(value, timezone):
     if not value:
         return None
     if isinstance(value, struct_time):
-        dt = datetime(*value[:6], tzinfo=ZoneInfo(timezone))
-        return dt.astimezone(ZoneInfo(timezone))
-    try:
-        dt = parser.parse(value)
-    except (TypeError, ValueError):
+        dt = datetime(*value[:6], tzinfo=_zone(timezone))
+        return dt.astimezone(_zone(timezone))
+    if not isinstance(value, str):
         return None
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo(timezone))
-    return dt.astimezone(ZoneInfo(timezone))
+    return _parse_cached(value, timezone)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_us(dt):
+    """Integer microseconds since the epoch for an aware datetime (exact)."""
+    return (dt - _EPOCH) // _MICROSECOND
 
 
 def make_hash(value):
@@ -40,6 +91,72 @@ def normalize_text(value):
     return re.sub(r"\s+", " ", value.strip())
 
 
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+
+def _tracking_param(name):
+    name = name.lower()
+    return any(
+        name.startswith(entry) if entry.endswith("_") else name == entry
+        for entry in URL_TRACKING_PARAMS
+    )
+
+
+@lru_cache(maxsize=8192)
+def canonical_url(url):
+    """Identity key for an article URL, for hashing and ids (not for links).
+
+    https, no www./m./mobile./amp. host prefix, default port, fragment, AMP
+    path segment, trailing slash or tracking parameters; the remaining query
+    is sorted. URL_HOST_RULES adds per-host query rules. Non-http(s) and
+    malformed values come back stripped but otherwise unchanged.
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        # Bad port or unbalanced IPv6 brackets in a publisher link.
+        return url
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix) :]
+            break
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+    rule = URL_HOST_RULES.get(host) or {}
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if segments and segments[-1].lower() == "amp":
+        segments.pop()
+    elif segments and segments[0].lower() == "amp":
+        segments.pop(0)
+    path = "/" + "/".join(segments)
+
+    keep = {name.lower() for name in rule.get("keep_params") or ()}
+    drop = {name.lower() for name in rule.get("drop_params") or ()}
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _tracking_param(name)
+        and name.lower() not in drop
+        and (not keep or name.lower() in keep)
+    )
+    query = f"?{urlencode(params)}" if params else ""
+    return f"https://{host}{path}{query}"
+
+
+def item_hash(item):
+    """sha256 of an item's canonical URL (or normalized title if it has none)."""
+    url = item.get("url")
+    key = canonical_url(url) if url else item.get("title")
+    return make_hash(normalize_text(key))
+
+
 def format_date(dt):
     return dt.strftime("%Y-%m-%d")
 
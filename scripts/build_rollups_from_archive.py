@@ -12,8 +12,9 @@ from crawler.config import (
     MONTHLY_DAYS,
     TABS,
 )
-from crawler.processor.aggregate import build_monthly_data, build_weekly_data, filter_by_range
-from crawler.utils import parse_datetime
+from crawler.archive_index import load_daily_items, load_rollup_days
+from crawler.processor.rollup import build_monthly_rollup, build_weekly_rollup
+from crawler.processor.timeindex import TimeIndex
 from crawler.llm.openai_client import summarize_issues
 
 
@@ -38,61 +39,6 @@ def write_archive_industry(tab, date_str, period, payload):
     target.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def iter_dates(start, end):
-    current = start.date()
-    end_date = end.date()
-    while current <= end_date:
-        yield current
-        current += timedelta(days=1)
-
-
-def load_archive_daily_items(start, end, timezone, tab):
-    items = []
-    for date in iter_dates(start, end):
-        date_str = date.strftime("%Y-%m-%d")
-        archive_path = (
-            INDUSTRY_ARCHIVE_DIR
-            / tab
-            / date_str.split("-")[0]
-            / date_str.split("-")[1]
-            / ARCHIVE_FILENAME_FORMAT.format(date=date_str, period="daily")
-        )
-        if not archive_path.exists():
-            continue
-        payload = json.loads(archive_path.read_text(encoding="utf-8"))
-        for card in payload.get("cards", []):
-            published_at = parse_datetime(card.get("publishedAt"), timezone)
-            if not published_at:
-                continue
-            items.append(
-                {
-                    "title": card.get("title"),
-                    "url": card.get("url"),
-                    "source": card.get("source"),
-                    "published_at": published_at,
-                    "summary": card.get("summary", []),
-                    "why": card.get("whyItMatters"),
-                    "topics": card.get("topics", []),
-                    "status": card.get("status"),
-                    "hash": card.get("hash"),
-                    "importanceScore": card.get("importanceScore"),
-                    "tab": card.get("tab", "ai"),
-                }
-            )
-    return items
-
-
-def sort_by_importance(items):
-    return sorted(
-        items,
-        key=lambda item: (
-            item.get("importanceScore") or 0,
-            item.get("published_at") or datetime.min,
-        ),
-        reverse=True,
-    )
-
-
 def pick_diverse_items(items, max_items=8):
     selected = []
     used_topics = set()
@@ -125,11 +71,11 @@ def main():
     today_str = now.strftime("%Y-%m-%d")
 
     for tab in TABS:
-        archive_items = load_archive_daily_items(monthly_start, now, TIMEZONE, tab)
-        weekly_items = filter_by_range(archive_items, weekly_start, now)
-        monthly_items = filter_by_range(archive_items, monthly_start, now)
-        weekly_items = sort_by_importance(weekly_items)
-        monthly_items = sort_by_importance(monthly_items)
+        archive_items = load_daily_items(INDUSTRY_ARCHIVE_DIR, tab, monthly_start, now, TIMEZONE)
+        rollup_days = load_rollup_days(INDUSTRY_ARCHIVE_DIR, tab, monthly_start, now, TIMEZONE)
+        archive_index = TimeIndex(archive_items)
+        monthly_items = archive_index.ranked(monthly_start, now)
+        weekly_items = archive_index.ranked(weekly_start, now)
 
         print(f"[{tab}] Archive items loaded: {len(archive_items)}")
         print(f"[{tab}] Weekly items: {len(weekly_items)}")
@@ -140,15 +86,15 @@ def main():
         weekly_issues = summarize_issues(weekly_issue_items, max_items=5, tab=tab)
         monthly_issues = summarize_issues(monthly_issue_items, max_items=5, tab=tab)
 
-        weekly_payload = build_weekly_data(
-            weekly_items,
+        weekly_payload = build_weekly_rollup(
+            rollup_days,
             len(weekly_items),
             weekly_start,
             now,
             issues=weekly_issues,
         )
-        monthly_payload = build_monthly_data(
-            monthly_items,
+        monthly_payload = build_monthly_rollup(
+            rollup_days,
             len(monthly_items),
             monthly_start,
             now,
@@ -0,0 +1,126 @@
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from crawler.archive_index import daily_archive_path, load_daily_items, load_rollup_days
+from crawler.config import MONTHLY_DAYS, TABS, TIMEZONE, WEEKLY_DAYS
+from crawler.processor.aggregate import build_monthly_data, build_weekly_data, filter_by_range
+from crawler.processor.rollup import build_monthly_rollup, build_weekly_rollup
+from crawler.processor.timeindex import TimeIndex, sort_by_importance
+from crawler.utils import parse_datetime
+
+
+# Differential check for the weekly/monthly rollups: for a range of run times,
+# the payloads build_rollups_from_archive.py writes (archive index + per-day
+# partials + TimeIndex) must equal build_weekly_data / build_monthly_data over
+# the cards read straight from the daily JSON files. Exits 1 on any mismatch.
+
+INDUSTRY_ARCHIVE_DIR = Path("archive/industry")
+
+
+def load_reference_items(archive_dir, tab, start, end, timezone):
+    items = []
+    day = start.date()
+    while day <= end.date():
+        path = Path(daily_archive_path(archive_dir, tab, day.strftime("%Y-%m-%d")))
+        day += timedelta(days=1)
+        if not path.exists():
+            continue
+        for card in json.loads(path.read_text(encoding="utf-8")).get("cards", []):
+            published_at = parse_datetime(card.get("publishedAt"), timezone)
+            if not published_at:
+                continue
+            items.append(
+                {
+                    "title": card.get("title"),
+                    "url": card.get("url"),
+                    "source": card.get("source"),
+                    "published_at": published_at,
+                    "summary": card.get("summary", []),
+                    "why": card.get("whyItMatters"),
+                    "topics": card.get("topics", []),
+                    "status": card.get("status"),
+                    "hash": card.get("hash"),
+                    "importanceScore": card.get("importanceScore"),
+                    "tab": card.get("tab", "ai"),
+                }
+            )
+    return filter_by_range(items, start, end)
+
+
+def _keys(items):
+    return [(item["url"], item["title"], item["published_at"]) for item in items]
+
+
+def check_window(archive_dir, tab, now, timezone):
+    """Names of the outputs that differ for one run time (empty when equal)."""
+    weekly_start = now - timedelta(days=WEEKLY_DAYS - 1)
+    monthly_start = now - timedelta(days=MONTHLY_DAYS - 1)
+
+    reference = load_reference_items(archive_dir, tab, monthly_start, now, timezone)
+    ref_weekly = sort_by_importance(filter_by_range(reference, weekly_start, now))
+    ref_monthly = sort_by_importance(filter_by_range(reference, monthly_start, now))
+
+    archive_items = load_daily_items(archive_dir, tab, monthly_start, now, timezone)
+    rollup_days = load_rollup_days(archive_dir, tab, monthly_start, now, timezone)
+    archive_index = TimeIndex(archive_items)
+    weekly_items = archive_index.ranked(weekly_start, now)
+    monthly_items = archive_index.ranked(monthly_start, now)
+
+    mismatches = []
+    if _keys(weekly_items) != _keys(ref_weekly):
+        mismatches.append("weekly items")
+    if _keys(monthly_items) != _keys(ref_monthly):
+        mismatches.append("monthly items")
+    expected = build_weekly_data(ref_weekly, len(ref_weekly), weekly_start, now)
+    actual = build_weekly_rollup(rollup_days, len(weekly_items), weekly_start, now)
+    if json.dumps(expected, ensure_ascii=False) != json.dumps(actual, ensure_ascii=False):
+        mismatches.append("weekly payload")
+    expected = build_monthly_data(ref_monthly, len(ref_monthly), monthly_start, now)
+    actual = build_monthly_rollup(rollup_days, len(monthly_items), monthly_start, now)
+    if json.dumps(expected, ensure_ascii=False) != json.dumps(actual, ensure_ascii=False):
+        mismatches.append("monthly payload")
+    return mismatches
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Compare archive rollups against a full recompute.")
+    parser.add_argument("--archive-dir", type=Path, default=INDUSTRY_ARCHIVE_DIR)
+    parser.add_argument("--tab", action="append", choices=TABS, help="Repeatable; default all tabs")
+    parser.add_argument("--start", type=str, help="First run date (YYYY-MM-DD); default 150 days before --end")
+    parser.add_argument("--end", type=str, help="Last run date (YYYY-MM-DD); default today")
+    parser.add_argument("--step-days", type=int, default=3)
+    parser.add_argument("--hours", type=str, default="7,23", help="Run times of day, e.g. 7,23")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    tz = ZoneInfo(TIMEZONE)
+    end = datetime.strptime(args.end, "%Y-%m-%d").date() if args.end else datetime.now(tz).date()
+    start = datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else end - timedelta(days=150)
+    hours = [int(hour) for hour in args.hours.split(",") if hour.strip()]
+
+    checked = 0
+    failed = 0
+    for tab in args.tab or TABS:
+        day = start
+        while day <= end:
+            for hour in hours:
+                now = datetime(day.year, day.month, day.day, hour, 13, tzinfo=tz)
+                mismatches = check_window(args.archive_dir, tab, now, TIMEZONE)
+                checked += 1
+                if mismatches:
+                    failed += 1
+                    print(f"[parity] {tab} {now.isoformat()}: {', '.join(mismatches)} differ")
+            day += timedelta(days=max(1, args.step_days))
+
+    print(f"[parity] {checked} windows checked, {failed} mismatched")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+import argparse
+import email.parser
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Local stand-in for the OpenAI chat completions endpoint, for exercising the
+# pipelines offline:
+#   python3 -m scripts.mock_openai_server --rpm 60 --latency 0.5
+#   OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=test python3 -m scripts.run_industry_pipeline
+# It also emulates the files/batches endpoints used by --llm-mode batch; a batch
+# completes --batch-delay seconds after it is created.
+
+
+def parse_input(prompt):
+    marker = prompt.rfind("Input: ")
+    if marker == -1:
+        return None
+    try:
+        return json.loads(prompt[marker + len("Input: ") :])
+    except ValueError:
+        return None
+
+
+def item_summary(payload):
+    title = (payload or {}).get("title") or "업데이트"
+    return {
+        "summary": [f"{title[:40]} 발표", "관련 내용이 공개됨", "후속 일정이 이어질 예정"],
+        "why": "업계 흐름 파악에 필요한 업데이트",
+        "topics": ["Policy"],
+        "status": "NEW",
+        "importanceScore": 5 + len(title) % 5,
+    }
+
+
+def build_reply(prompt):
+    payload = parse_input(prompt)
+    if "증권사 관련 이벤트" in prompt:
+        return [
+            {
+                "id": entry.get("id"),
+                "keep": True,
+                "oneLiner": f"{entry.get('company', '')} 업데이트",
+                "type_raw": "출시",
+                "areas_raw": ["기타"],
+                "confidence": 0.8,
+            }
+            for entry in payload or []
+        ]
+    if "한 줄 설명" in prompt:
+        return {entry.get("id"): "개발자 도구 업데이트입니다" for entry in payload or []}
+    if "주요 이슈로 재요약" in prompt:
+        return [
+            {
+                "id": f"issue_{idx:03d}",
+                "status": "NEW",
+                "title": entry.get("title") or "이슈",
+                "summary": "관련 업데이트가 이어지고 있음",
+                "articleCount": 1,
+                "relatedArticles": [],
+            }
+            for idx, entry in enumerate((payload or [])[:5], start=1)
+        ]
+    if '"bullets"' in prompt:
+        hint = prompt.split("형식: ", 1)[-1].split("]}", 1)[0]
+        bullets = [f"핵심: 주요 발표 {idx}" for idx in range(1, hint.count("...") + 1)]
+        if "트렌드" in hint:
+            bullets[-1] = "트렌드: 정책 관련 흐름이 이어짐"
+        return {"bullets": bullets}
+    if isinstance(payload, list):
+        return [{"id": entry.get("id"), **item_summary(entry)} for entry in payload]
+    return item_summary(payload)
+
+
+def shape_reply(reply, response_format):
+    # Structured-output requests get their array/map wrapped under the schema's
+    # single top-level key, the way a schema-constrained reply would look.
+    schema = ((response_format or {}).get("json_schema") or {}).get("schema") or {}
+    properties = list(schema.get("properties") or {})
+    if not properties or (isinstance(reply, dict) and set(reply) <= set(properties)):
+        return reply
+    if isinstance(reply, dict):
+        reply = [{"id": key, "text": value} for key, value in reply.items()]
+    return {properties[0]: reply}
+
+
+class MockState:
+    def __init__(self, args):
+        self.args = args
+        self.lock = threading.Lock()
+        self.recent = deque()
+        self.requests = 0
+        self.throttled = 0
+        self.files = {}
+        self.batches = {}
+
+    def add_file(self, data, filename, purpose):
+        with self.lock:
+            file_id = f"file-mock-{len(self.files) + 1}"
+            self.files[file_id] = data
+        return {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(data),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "status": "processed",
+        }
+
+    def create_batch(self, request):
+        input_file_id = request.get("input_file_id")
+        with self.lock:
+            batch_id = f"batch-mock-{len(self.batches) + 1}"
+            batch = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": request.get("endpoint"),
+                "input_file_id": input_file_id,
+                "completion_window": request.get("completion_window"),
+                "status": "in_progress",
+                "created_at": int(time.time()),
+                "metadata": request.get("metadata"),
+                "output_file_id": None,
+            }
+            self.batches[batch_id] = batch
+        return batch
+
+    def refresh_batch(self, batch_id):
+        batch = self.batches.get(batch_id)
+        if not batch or batch["status"] != "in_progress":
+            return batch
+        if time.time() - batch["created_at"] < self.args.batch_delay:
+            return batch
+        lines = []
+        for raw in self.files.get(batch["input_file_id"], b"").decode("utf-8").splitlines():
+            if not raw.strip():
+                continue
+            entry = json.loads(raw)
+            if self.args.drop_rate and random.random() < self.args.drop_rate:
+                continue
+            lines.append(
+                {
+                    "id": f"batch_req_{len(lines) + 1}",
+                    "custom_id": entry.get("custom_id"),
+                    "response": {
+                        "status_code": 200,
+                        "request_id": f"req_{random.randrange(1 << 30)}",
+                        "body": chat_completion(entry.get("body") or {}, self.args),
+                    },
+                    "error": None,
+                }
+            )
+        output = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+        output_file = self.add_file(output.encode("utf-8"), f"{batch_id}_output.jsonl", "batch_output")
+        with self.lock:
+            batch.update(
+                status="completed",
+                output_file_id=output_file["id"],
+                completed_at=int(time.time()),
+                request_counts={"total": len(lines), "completed": len(lines), "failed": 0},
+            )
+        return batch
+
+    def admit(self):
+        now = time.monotonic()
+        with self.lock:
+            while self.recent and now - self.recent[0] > 60:
+                self.recent.popleft()
+            if self.args.rpm and len(self.recent) >= self.args.rpm:
+                self.throttled += 1
+                return False, 60 - (now - self.recent[0]), 0
+            self.recent.append(now)
+            self.requests += 1
+            remaining = (self.args.rpm - len(self.recent)) if self.args.rpm else 10000
+            return True, 0, remaining
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):
+            if state.args.verbose:
+                super().log_message(fmt, *args)
+
+        def send_json(self, status, payload, headers=None):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def read_upload(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            head = f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("utf-8")
+            message = email.parser.BytesParser().parsebytes(head + self.rfile.read(length))
+            fields = {}
+            for part in message.get_payload():
+                name = part.get_param("name", header="content-disposition")
+                fields[name] = (part.get_filename(), part.get_payload(decode=True))
+            return fields
+
+        def do_GET(self):
+            path = self.path.rstrip("/")
+            match = re.search(r"/files/([^/]+)/content$", path)
+            if match and match.group(1) in state.files:
+                body = state.files[match.group(1)]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            match = re.search(r"/batches/([^/]+)$", path)
+            if match and match.group(1) in state.batches:
+                self.send_json(200, state.refresh_batch(match.group(1)))
+                return
+            self.send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+        def do_POST(self):
+            path = self.path.rstrip("/")
+            if path.endswith("/files"):
+                fields = self.read_upload()
+                filename, data = fields.get("file", (None, b""))
+                purpose = (fields.get("purpose", (None, b""))[1] or b"").decode("utf-8")
+                self.send_json(200, state.add_file(data or b"", filename or "upload.jsonl", purpose))
+                return
+            if path.endswith("/batches"):
+                self.send_json(200, state.create_batch(self.read_json()))
+                return
+            match = re.search(r"/batches/([^/]+)/cancel$", path)
+            if match and match.group(1) in state.batches:
+                batch = state.batches[match.group(1)]
+                batch["status"] = "cancelled"
+                self.send_json(200, batch)
+                return
+            if not path.endswith("/chat/completions"):
+                self.send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+                return
+            request = self.read_json()
+            admitted, wait, remaining = state.admit()
+            limit_headers = {
+                "x-ratelimit-limit-requests": str(state.args.rpm or 10000),
+                "x-ratelimit-remaining-requests": str(remaining),
+                "x-ratelimit-reset-requests": f"{max(wait, 0.001):.3f}s",
+            }
+            if not admitted:
+                self.send_json(
+                    429,
+                    {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                    {**limit_headers, "retry-after-ms": str(int(wait * 1000))},
+                )
+                return
+            if state.args.latency:
+                time.sleep(state.args.latency)
+            self.send_json(200, chat_completion(request, state.args), limit_headers)
+
+    return Handler
+
+
+def chat_completion(request, args):
+    messages = request.get("messages") or []
+    prompt = messages[-1].get("content", "") if messages else ""
+    reply = build_reply(prompt)
+    if args.drop_rate and isinstance(reply, list):
+        reply = [entry for entry in reply if random.random() >= args.drop_rate]
+    reply = shape_reply(reply, request.get("response_format"))
+    content = json.dumps(reply, ensure_ascii=False)
+    if args.fail_rate and random.random() < args.fail_rate:
+        content = "죄송합니다, " + content[: len(content) // 2]
+    prompt_tokens = len(re.findall(r"\S+", prompt))
+    return {
+        "id": f"chatcmpl-mock-{random.randrange(1 << 30)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model") or "mock",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(content) // 2,
+            "total_tokens": prompt_tokens + len(content) // 2,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible server for offline runs")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to sleep per completion")
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute before returning 429 (0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Fraction of replies to corrupt")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="Fraction of array elements to omit")
+    parser.add_argument("--batch-delay", type=float, default=2.0, help="Seconds before a batch completes")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    state = MockState(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"[mock] listening on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"[mock] requests={state.requests} throttled={state.throttled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,8 @@ from crawler.fetchers.github import (
     search_recent_repos,
 )
 from crawler.fetchers.hn import fetch_hacker_news_trending
+from crawler.llm import cache as llm_cache
+from crawler.llm import stats as llm_stats
 from crawler.llm.openai_client import summarize_developer_oneliners
 from crawler.run_stats import write_run_and_history
 from crawler.utils import normalize_text, sha1_text
@@ -532,6 +534,8 @@ def main():
         "clusters": len(clusters),
         "new": new_count,
     }
+    run_stats["llm"] = llm_stats.snapshot()
+    llm_cache.close()
 
     write_run_and_history(
         output_dir / "run.json",
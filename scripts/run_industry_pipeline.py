@@ -1,7 +1,5 @@
 import argparse
 import json
-import html
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -18,18 +16,27 @@ from crawler.config import (
     TIMEZONE,
     WEEKLY_DAYS,
 )
+from crawler.archive_index import load_daily_items, load_rollup_days
 from crawler.fetchers.huggingface import fetch_huggingface_trending
 from crawler.fetchers.rss import fetch_rss_sources
-from crawler.llm.openai_client import summarize_daily_highlights, summarize_item, summarize_issues
+from crawler.llm import cache as llm_cache
+from crawler.llm import stats as llm_stats
+from crawler.llm.openai_client import (
+    summarize_daily_highlights,
+    summarize_issues,
+    summarize_items,
+    summarize_items_offline,
+)
 from crawler.processor.aggregate import (
     build_cards,
     build_daily_summary,
-    build_monthly_data,
-    build_weekly_data,
     filter_by_range,
 )
 from crawler.processor.dedupe import dedupe_items
-from crawler.utils import parse_datetime
+from crawler.processor.prefilter import apply_prefilters
+from crawler.processor.rollup import build_monthly_rollup, build_weekly_rollup
+from crawler.processor.timeindex import TimeIndex, sort_by_importance
+from crawler.processor import seen as seen_index
 from crawler.run_stats import write_run_and_history
 
 
@@ -54,7 +61,7 @@ def write_archive_industry(tab, date_str, period, payload):
     target.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def load_items(selected_tabs=None):
+def load_items(selected_tabs=None, prefilter_stats=None):
     timezone = TIMEZONE
 
     selected_set = set(selected_tabs) if selected_tabs else None
@@ -65,374 +72,7 @@ def load_items(selected_tabs=None):
     )
     rss_items = fetch_rss_sources(rss_sources, timezone)
 
-    # Strong prefilter for korea.kr policy RSS in finance tab.
-    finance_policy_anchors = [
-        "금융위",
-        "금융위원회",
-        "금감원",
-        "금융감독원",
-
-        "은행",
-        "대출",
-        "예금",
-        "가계부채",
-        "금리",
-        "부동산PF",
-        "금융권",
-        "보험사",
-        "보험회사",
-        "보험업",
-        "보험료",
-        "보험금",
-        "증권",
-        "자본시장",
-        "금융지원",
-        "금융정책",
-        "자본시장법",
-        "공매도",
-        "불공정거래",
-        "주가조작",
-        "시장조성",
-        "파생",
-        "파생상품",
-        "공시",
-        "상장",
-        "회계",
-        "감리",
-        "불완전판매",
-
-        "전자금융",
-        "핀테크",
-        "오픈뱅킹",
-        "마이데이터",
-        "간편결제",
-        "결제",
-        "송금",
-
-        "가상자산",
-        "디지털자산",
-        "스테이블코인",
-        "STO",
-        "대체거래소",
-        "거래소",
-        "예탁결제원",
-        "자금세탁",
-        "AML",
-        "이상거래",
-        "FDS",
-        "내부통제",
-
-        "개인정보",
-        "개인정보보호",
-        "유출",
-        "해킹",
-        "피싱",
-        "스미싱",
-        "보이스피싱",
-        "취약점",
-        "보안",
-        "본인인증",
-        "인증서",
-        "전자서명",
-        "인증수단",
-        "인증체계",
-        "금융보안",
-    ]
-
-    finance_policy_qualifiers = [
-        "감독",
-        "규제",
-        "지침",
-        "가이드",
-        "가이드라인",
-        "입법",
-        "법안",
-        "시행령",
-        "제도",
-        "개정",
-        "정비",
-        "대책",
-        "방안",
-        "발표",
-        "시행",
-        "추진",
-        "강화",
-        "제재",
-        "과징금",
-        "과태료",
-        "행정처분",
-    ]
-
-    finance_policy_always = [
-        # These are usually finance/reg/security even without explicit policy verbs.
-        "마이데이터",
-        "오픈뱅킹",
-        "전자금융",
-        "금융보안",
-        "가상자산",
-        "디지털자산",
-        "스테이블코인",
-        "STO",
-        "자금세탁",
-        "AML",
-        "FDS",
-        "이상거래",
-        "개인정보",
-        "유출",
-        "해킹",
-        "피싱",
-        "스미싱",
-        "보이스피싱",
-        "취약점",
-    ]
-
-    realestate_anchors = [
-        "부동산",
-        "주택",
-        "아파트",
-        "집값",
-        "가격",
-        "거래",
-        "매매",
-        "청약",
-        "분양",
-        "임대",
-        "전세",
-        "월세",
-        "전월세",
-        "전세값",
-        "월세값",
-        "임대차",
-        "재건축",
-        "재개발",
-        "정비사업",
-        "공급",
-        "택지",
-        "공시가격",
-        "공시지가",
-        "주담대",
-        "주택담보",
-        "LTV",
-        "DTI",
-        "DSR",
-        "취득세",
-        "양도세",
-        "종부세",
-        "재산세",
-        "PF",
-        "미분양",
-    ]
-
-    realestate_policy_signals = [
-        "정책",
-        "대책",
-        "규제",
-        "완화",
-        "강화",
-        "지원",
-        "시행",
-        "개정",
-        "입법",
-        "법안",
-        "고시",
-        "공고",
-        "가이드",
-        "방안",
-        "발표",
-        "계획",
-        "시정",
-        "억제",
-        "안정",
-        "안정화",
-        "관리",
-        "단속",
-        "점검",
-        "대응",
-        "조치",
-        "개선",
-        "방침",
-        "지시",
-        "당정",
-        "정부",
-        "대통령실",
-        "국회",
-        "투기",
-        "과열",
-        "검토",
-        "추진",
-        "논의",
-        "협의",
-        "TF",
-        "시범",
-        "관계부처",
-        "국토교통부",
-        "국토부",
-        "LH",
-        "주택도시기금",
-    ]
-
-    realestate_soft_signals = [
-        "매물",
-        "공급",
-        "양도세",
-        "임대사업자",
-        "등록임대",
-        "다주택",
-        "1주택",
-        "실거주",
-        "유예",
-        "세제",
-        "세금",
-        "취득세",
-        "종부세",
-        "재산세",
-        "전월세",
-        "전세",
-        "월세",
-        "매도",
-        "매수",
-    ]
-
-    realestate_media_excludes = [
-        "매물마당",
-        "분양캘린더",
-        "시세",
-        "급매",
-        "신고가",
-        "청약경쟁률",
-        "수주",
-        "실적",
-    ]
-
-    def is_finance_policy_item(item):
-        if item.get("kind") != "rss":
-            return False
-        if item.get("tab") != "finance":
-            return False
-        return item.get("source") == "정책브리핑"
-
-    def finance_policy_match(item):
-        title = item.get("title") or ""
-        snippet = item.get("snippet") or ""
-
-        # Strip HTML (korea.kr snippets are HTML-heavy).
-        snippet = html.unescape(snippet)
-        snippet = re.sub(r"<[^>]+>", " ", snippet)
-        snippet = re.sub(r"\s+", " ", snippet).strip()
-
-        # korea.kr policy RSS often includes a long ministry contact footer ("문의:"),
-        # which can create false positives (e.g. unrelated policies listing 금융위원회).
-
-        cut_markers = (
-            "문의:",
-            "문의 :",
-            "문의처",
-            "문의사항:",
-            "담당부서",
-            "첨부파일",
-            "자료출처",
-            "관련자료",
-        )
-        cut_index = None
-        for marker in cut_markers:
-            idx = snippet.find(marker)
-            if idx == -1:
-                continue
-            cut_index = idx if cut_index is None else min(cut_index, idx)
-        if cut_index is not None:
-            snippet = snippet[:cut_index]
-
-        body = snippet[:800]
-        title_l = title.lower()
-        text_l = f"{title} {body}".lower()
-
-        if any(k.lower() in title_l for k in finance_policy_anchors):
-            return True
-        if any(k.lower() in text_l for k in finance_policy_always):
-            return True
-        if any(k.lower() in text_l for k in finance_policy_anchors) and any(
-            k.lower() in text_l for k in finance_policy_qualifiers
-        ):
-            return True
-        return False
-
-    def is_realestate_item(item):
-        if item.get("kind") != "rss":
-            return False
-        return item.get("tab") == "realestate"
-
-    def realestate_policy_match(item):
-        title = item.get("title") or ""
-        snippet = item.get("snippet") or ""
-        source = item.get("source") or ""
-
-        snippet = html.unescape(snippet)
-        snippet = re.sub(r"<[^>]+>", " ", snippet)
-        snippet = re.sub(r"\s+", " ", snippet).strip()
-
-        cut_markers = (
-            "문의:",
-            "문의 :",
-            "문의처",
-            "문의사항:",
-            "담당부서",
-            "첨부파일",
-            "자료출처",
-            "관련자료",
-        )
-        cut_index = None
-        for marker in cut_markers:
-            idx = snippet.find(marker)
-            if idx == -1:
-                continue
-            cut_index = idx if cut_index is None else min(cut_index, idx)
-        if cut_index is not None:
-            snippet = snippet[:cut_index]
-
-        body = snippet[:800]
-        title_l = title.lower()
-        text_l = f"{title} {body}".lower()
-        source_l = source.lower()
-
-        has_anchor_title = any(k.lower() in title_l for k in realestate_anchors)
-        has_anchor = has_anchor_title or any(k.lower() in text_l for k in realestate_anchors)
-        has_signal = any(k.lower() in text_l for k in realestate_policy_signals)
-        has_soft_signal_title = any(k.lower() in title_l for k in realestate_soft_signals)
-
-        is_media = source_l in {"한국경제(부동산)", "매일경제(부동산)", "헤럴드경제(부동산)"}
-        if is_media:
-            if any(k.lower() in title_l for k in realestate_media_excludes):
-                return False
-            if has_anchor and has_signal:
-                return True
-            return has_anchor_title and has_soft_signal_title
-
-        if source_l == "정책브리핑":
-            return has_anchor and has_signal
-
-        return has_anchor and has_signal
-
-    if selected_set is None or "finance" in selected_set:
-        policy_total = len([item for item in rss_items if is_finance_policy_item(item)])
-        rss_items = [
-            item
-            for item in rss_items
-            if (not is_finance_policy_item(item)) or finance_policy_match(item)
-        ]
-        policy_kept = len([item for item in rss_items if is_finance_policy_item(item)])
-        if policy_total:
-            print(f"[finance] korea.kr policy kept: {policy_kept}/{policy_total}")
-
-    if selected_set is None or "realestate" in selected_set:
-        realestate_total = len([item for item in rss_items if is_realestate_item(item)])
-        rss_items = [
-            item
-            for item in rss_items
-            if (not is_realestate_item(item)) or realestate_policy_match(item)
-        ]
-        realestate_kept = len([item for item in rss_items if is_realestate_item(item)])
-        if realestate_total:
-            print(f"[realestate] policy-signal kept: {realestate_kept}/{realestate_total}")
+    rss_items = apply_prefilters(rss_items, stats=prefilter_stats)
 
     hf_items = fetch_huggingface_trending(timezone) if (selected_set is None or "ai" in selected_set) else []
     print(f"RSS items: {len(rss_items)}")
@@ -448,21 +88,42 @@ def count_by_source(items):
     return counts
 
 
-def enrich_items(items):
+def enrich_items(items, llm_mode="sync", enrich_stats=None):
+    # Items enriched by an earlier run (same canonical URL and text) keep their
+    # stored fields; only new or changed items go to the LLM.
+    carried = seen_index.lookup_many(items)
+    new_items = [item for idx, item in enumerate(items) if idx not in carried]
+    if llm_mode == "batch":
+        summaries = summarize_items_offline(new_items)
+    else:
+        # Short items are summarized several per request within a tab; requests
+        # run concurrently under the shared rate limiter and keep input order.
+        summaries = summarize_items(new_items)
+    summaries = iter(summaries)
     enriched = []
-    for item in items:
-        tab = item.get("tab", "ai")
-        summary = summarize_item(item, tab=tab)
-        enriched.append(
-            {
-                **item,
-                "summary": summary["summary"],
-                "why": summary["why"],
-                "topics": summary["topics"],
-                "status": summary["status"],
-                "importanceScore": summary["importanceScore"],
-            }
-        )
+    fresh = []
+    fallbacks = 0
+    for idx, item in enumerate(items):
+        summary = carried.get(idx) or next(summaries)
+        entry = {
+            **item,
+            "summary": summary["summary"],
+            "why": summary["why"],
+            "topics": summary["topics"],
+            "status": summary["status"],
+            "importanceScore": summary["importanceScore"],
+        }
+        enriched.append(entry)
+        if summary.get("fallback"):
+            # Placeholder summaries are retried next run instead of carried.
+            fallbacks += 1
+        elif idx not in carried:
+            fresh.append(entry)
+    seen_index.store_many(fresh)
+    if enrich_stats is not None:
+        enrich_stats["new"] = len(new_items)
+        enrich_stats["carried"] = len(carried)
+        enrich_stats["fallback"] = fallbacks
     return enriched
 
 
@@ -559,17 +220,6 @@ def build_daily_payload(items, raw_count, now, tab="ai"):
     return daily
 
 
-def sort_by_importance(items):
-    return sorted(
-        items,
-        key=lambda item: (
-            item.get("importanceScore") or 0,
-            item.get("published_at") or datetime.min,
-        ),
-        reverse=True,
-    )
-
-
 def pick_diverse_items(items, max_items=8):
     selected = []
     used_topics = set()
@@ -607,50 +257,6 @@ def select_diverse_by_source(items, max_total=5, max_per_source=2):
     return selected
 
 
-def iter_dates(start, end):
-    current = start.date()
-    end_date = end.date()
-    while current <= end_date:
-        yield current
-        current += timedelta(days=1)
-
-
-def load_archive_daily_items(start, end, timezone, tab):
-    items = []
-    for date in iter_dates(start, end):
-        date_str = date.strftime("%Y-%m-%d")
-        archive_path = (
-            INDUSTRY_ARCHIVE_DIR
-            / tab
-            / date_str.split("-")[0]
-            / date_str.split("-")[1]
-            / ARCHIVE_FILENAME_FORMAT.format(date=date_str, period="daily")
-        )
-        if not archive_path.exists():
-            continue
-        payload = json.loads(archive_path.read_text(encoding="utf-8"))
-        for card in payload.get("cards", []):
-            published_at = parse_datetime(card.get("publishedAt"), timezone)
-            if not published_at:
-                continue
-            items.append(
-                {
-                    "title": card.get("title"),
-                    "url": card.get("url"),
-                    "source": card.get("source"),
-                    "published_at": published_at,
-                    "summary": card.get("summary", []),
-                    "why": card.get("whyItMatters"),
-                    "topics": card.get("topics", []),
-                    "status": card.get("status"),
-                    "hash": card.get("hash"),
-                    "importanceScore": card.get("importanceScore"),
-                    "tab": card.get("tab", "ai"),
-                }
-            )
-    return items
-
-
 def group_by_tab(items, tabs):
     grouped = {tab: [] for tab in tabs}
     for item in items:
@@ -667,6 +273,13 @@ def parse_args():
         default=None,
         help="Only run a specific tab (repeatable; comma-separated supported).",
     )
+    parser.add_argument(
+        "--llm-mode",
+        type=str,
+        default="sync",
+        choices=["sync", "batch"],
+        help="batch submits item summaries through the OpenAI Batch API (slower, cheaper).",
+    )
     return parser.parse_args()
 
 
@@ -716,7 +329,11 @@ def main():
     }
 
     try:
-        raw_items = load_items(selected_tabs=selected_tabs)
+        run_stats["pipeline"]["prefilter"] = {}
+        raw_items = load_items(
+            selected_tabs=selected_tabs,
+            prefilter_stats=run_stats["pipeline"]["prefilter"],
+        )
         run_stats["pipeline"]["rawTotal"] = len(raw_items)
 
         run_stats["sources"] = {
@@ -742,20 +359,29 @@ def main():
         print(f"[quota] raw by tab after clamp: {run_stats['pipeline']['rawByTabAfterClamp']}")
         print(f"Total raw items (clamped): {len(raw_items)}")
 
-        deduped = dedupe_items(raw_items)
+        deduped = dedupe_items(raw_items, stats=run_stats["pipeline"])
         run_stats["pipeline"]["deduped"] = len(deduped)
-        print(f"Deduped items: {len(deduped)}")
+        print(f"Deduped items: {len(deduped)} (near-duplicates collapsed: {run_stats['pipeline'].get('nearDuplicates', 0)})")
 
         deduped = [item for item in deduped if item.get("tab", "ai") in selected_set]
         run_stats["pipeline"]["dedupedSelected"] = len(deduped)
         print(f"Deduped items (selected tabs): {len(deduped)}")
 
-        # One summarize_item call per deduped item.
-        run_stats["llm"]["itemCalls"] = len(deduped)
-
-        enriched = enrich_items(deduped)
+        run_stats["llm"]["mode"] = args.llm_mode
+        run_stats["pipeline"]["enrich"] = {}
+        enriched = enrich_items(
+            deduped,
+            llm_mode=args.llm_mode,
+            enrich_stats=run_stats["pipeline"]["enrich"],
+        )
+        # Only items not carried over from earlier runs get a summary
+        # (batched, single or cached).
+        run_stats["llm"]["itemCalls"] = run_stats["pipeline"]["enrich"]["new"]
         run_stats["pipeline"]["enriched"] = len(enriched)
-        print(f"Enriched items: {len(enriched)}")
+        print(
+            f"Enriched items: {len(enriched)} "
+            f"(new: {run_stats['pipeline']['enrich']['new']}, carried: {run_stats['pipeline']['enrich']['carried']})"
+        )
 
         daily_start = now - timedelta(hours=DAILY_HOURS)
         weekly_start = now - timedelta(days=WEEKLY_DAYS - 1)
@@ -778,11 +404,11 @@ def main():
             write_latest_industry(tab, "daily.json", daily_payload)
             write_archive_industry(tab, today_str, "daily", daily_payload)
 
-            archive_items = load_archive_daily_items(monthly_start, now, TIMEZONE, tab)
-            weekly_items = filter_by_range(archive_items, weekly_start, now)
-            monthly_items = filter_by_range(archive_items, monthly_start, now)
-            weekly_items = sort_by_importance(weekly_items)
-            monthly_items = sort_by_importance(monthly_items)
+            archive_items = load_daily_items(INDUSTRY_ARCHIVE_DIR, tab, monthly_start, now, TIMEZONE)
+            rollup_days = load_rollup_days(INDUSTRY_ARCHIVE_DIR, tab, monthly_start, now, TIMEZONE)
+            archive_index = TimeIndex(archive_items)
+            monthly_items = archive_index.ranked(monthly_start, now)
+            weekly_items = archive_index.ranked(weekly_start, now)
             print(f"[{tab}] Weekly items from archive: {len(weekly_items)}")
             print(f"[{tab}] Monthly items from archive: {len(monthly_items)}")
 
@@ -794,15 +420,15 @@ def main():
             weekly_issues = summarize_issues(weekly_issue_items, max_items=5, tab=tab)
             monthly_issues = summarize_issues(monthly_issue_items, max_items=5, tab=tab)
 
-            weekly_payload = build_weekly_data(
-                weekly_items,
+            weekly_payload = build_weekly_rollup(
+                rollup_days,
                 len(weekly_items),
                 weekly_start,
                 now,
                 issues=weekly_issues,
             )
-            monthly_payload = build_monthly_data(
-                monthly_items,
+            monthly_payload = build_monthly_rollup(
+                rollup_days,
                 len(monthly_items),
                 monthly_start,
                 now,
@@ -825,6 +451,8 @@ def main():
         errors.append({"message": repr(exc)})
         raise
     finally:
+        run_stats["llm"].update(llm_stats.snapshot())
+        llm_cache.close()
         try:
             write_industry_run_stats(run_stats)
         except Exception:
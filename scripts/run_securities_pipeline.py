@@ -6,18 +6,25 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from crawler.config import TIMEZONE
+from crawler.llm import stats as llm_stats
 from crawler.market.appstore import build_items as build_appstore_items
 from crawler.market.appstore_apps import APPS as APPSTORE_APPS
+from crawler.market.cache_store import EnrichmentCache
 from crawler.market.dart import (
     build_corp_code_map,
     build_disclosure_url,
-    list_disclosures,
+    fetch_corp_codes,
+    list_disclosures_many,
+    list_market_disclosures,
     parse_rcept_date,
 )
 from crawler.market.failures import append_failure
 from crawler.market.keywords import is_ai_candidate
-from crawler.market.llm_batch import enrich_items, enrich_items_profile
-from crawler.market.news_rss import build_items as build_news_items
+from crawler.market.llm_batch import enrich_items, enrich_items_offline, enrich_items_profile
+from crawler.market.news_rss import (
+    build_items as build_news_items,
+    fetch_entries as fetch_news_entries,
+)
 from crawler.market.updates_keywords import is_updates_candidate
 from crawler.market.taxonomy import (
     AREA_RAW_CHOICES,
@@ -30,6 +37,7 @@ from crawler.run_stats import write_run_and_history
 
 DEFAULT_DATASET = "all"
 DATASET_CHOICES = ["all", "securities-ai", "securities-updates"]
+DART_FILTERS = {"pblntf_ty": ["B", "E", "I"], "last_reprt_at": "Y"}
 
 
 def dataset_dirs(dataset):
@@ -46,33 +54,6 @@ def load_index_companies(securities_dir):
     return payload.get("companies", [])
 
 
-def load_cache(cache_path):
-    cache_path = Path(cache_path)
-    if not cache_path.exists():
-        return {}
-    cache = {}
-    with cache_path.open("r", encoding="utf-8") as file:
-        for line in file:
-            if not line.strip():
-                continue
-            payload = json.loads(line)
-            entry_id = payload.get("id")
-            if entry_id:
-                cache[entry_id] = payload
-    return cache
-
-
-def append_cache(items, cache_path, archive_dir):
-    if not items:
-        return
-    archive_dir = Path(archive_dir)
-    cache_path = Path(cache_path)
-    archive_dir.mkdir(parents=True, exist_ok=True)
-    with cache_path.open("a", encoding="utf-8") as file:
-        for item in items:
-            file.write(json.dumps(item, ensure_ascii=False) + "\n")
-
-
 def to_month(date_str):
     return date_str[:7]
 
@@ -135,17 +116,120 @@ def write_unmatched(unmatched, archive_dir):
     write_json(path, {"unmatched": unmatched})
 
 
-def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
+def fetch_sources(now, start, end, companies, dart_key, dart_listing="corp"):
+    """Fetch App Store, DART and news items once for every dataset of a run.
+
+    Disclosures are listed for the union of the datasets' companies and news
+    entries are kept unmatched, so each dataset selects its own companies
+    afterwards. Failures are collected rather than logged so that every
+    dataset records them in its own failure log and run stats. dart_listing
+    "market" lists all filings once per type instead of per company.
+    """
+    fetched = {
+        "failures": [],
+        "errors": [],
+        "appstore": {"items": [], "fetched": set(), "failed": []},
+        "corpEntries": None,
+        "disclosures": {},
+        "dartStats": {"listing": dart_listing},
+        "newsEntries": None,
+    }
+    appstore = fetched["appstore"]
+
+    def on_appstore_failure(company, track_id, exc):
+        appstore["failed"].append(
+            {"company": company, "trackId": track_id, "error": repr(exc)}
+        )
+        fetched["failures"].append(
+            {
+                "source_type": "app_store",
+                "message": "App Store fetch failed",
+                "detail": f"trackId={track_id} err={repr(exc)}",
+                "company": company,
+            }
+        )
+
+    def on_appstore_fetched(company, track_id):
+        appstore["fetched"].add(str(track_id))
+
+    try:
+        appstore["items"] = build_appstore_items(
+            APPSTORE_APPS,
+            start,
+            end,
+            now,
+            on_failure=on_appstore_failure,
+            on_fetched=on_appstore_fetched,
+        )
+    except Exception as exc:
+        fetched["failures"].append(
+            {"source_type": "app_store", "message": "App Store fetch failed", "detail": repr(exc)}
+        )
+        fetched["errors"].append({"source": "app_store", "message": repr(exc)})
+
+    if dart_key:
+        try:
+            fetched["corpEntries"] = fetch_corp_codes(dart_key)
+        except Exception as exc:
+            fetched["failures"].append(
+                {"source_type": "dart", "message": "DART fetch failed", "detail": repr(exc)}
+            )
+            fetched["errors"].append({"source": "dart", "message": repr(exc)})
+    if fetched["corpEntries"] is not None:
+        corp_map, _unmatched = build_corp_code_map(
+            companies, dart_key, corp_entries=fetched["corpEntries"]
+        )
+        listing = list_market_disclosures if dart_listing == "market" else list_disclosures_many
+        by_corp = listing(
+            dart_key,
+            list(corp_map.values()),
+            start,
+            end,
+            pblntf_ty=DART_FILTERS["pblntf_ty"],
+            last_reprt_at=DART_FILTERS["last_reprt_at"],
+            stats=fetched["dartStats"],
+        )
+        for company, corp_code in corp_map.items():
+            items = []
+            for entry in by_corp.get(corp_code, []):
+                item = build_item(company, corp_code, entry)
+                if not item.get("date"):
+                    continue
+                items.append(item)
+            fetched["disclosures"][company] = items
+
+    try:
+        fetched["newsEntries"] = fetch_news_entries()
+    except Exception as exc:
+        fetched["failures"].append(
+            {"source_type": "news", "message": "News fetch failed", "detail": repr(exc)}
+        )
+        fetched["errors"].append({"source": "news", "message": repr(exc)})
+
+    return fetched
+
+
+def shared_sources(shared, args, now, start, end, dart_key):
+    # The first dataset fetches inside its own run, so a fetch error still
+    # lands in that dataset's run.json; later datasets reuse the result.
+    if "fetched" not in shared:
+        shared["fetched"] = fetch_sources(
+            now, start, end, shared["companies"], dart_key, dart_listing=args.dart_listing
+        )
+    return shared["fetched"]
+
+
+def run_dataset(args, now, start, end, dataset, companies, shared, *, openai_key, dart_key):
     securities_dir, archive_dir = dataset_dirs(dataset)
-    cache_path = archive_dir / "cache.jsonl"
     failures_path = archive_dir / "source_failures.jsonl"
     run_path = securities_dir / "run.json"
     run_history_path = securities_dir / "run_history.json"
 
-    companies = load_index_companies(securities_dir)
     raw_items = []
+    llm_stats.reset()
 
     run_errors = []
+    cache = None
     run_stats = {
         "id": now.isoformat(),
         "ts": now.isoformat(),
@@ -160,98 +244,57 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
         },
         "sources": {},
         "filters": {},
-        "llm": {},
+        "llm": {"mode": args.llm_mode},
         "output": {},
         "errors": run_errors,
     }
 
     try:
-        appstore_failed = []
-        appstore_fetched = set()
-
-        def on_appstore_failure(company, track_id, exc):
-            appstore_failed.append(
-                {"company": company, "trackId": track_id, "error": repr(exc)}
-            )
-            log_failure(
-                failures_path,
-                "app_store",
-                now,
-                "App Store fetch failed",
-                detail=f"trackId={track_id} err={repr(exc)}",
-                company=company,
-            )
-
-        def on_appstore_fetched(company, track_id):
-            appstore_fetched.add(str(track_id))
-
-        try:
-            appstore_items = build_appstore_items(
-                APPSTORE_APPS,
-                start,
-                end,
-                now,
-                on_failure=on_appstore_failure,
-                on_fetched=on_appstore_fetched,
-            )
-            raw_items.extend(appstore_items)
-        except Exception as exc:
-            log_failure(failures_path, "app_store", now, "App Store fetch failed", detail=repr(exc))
-            run_errors.append({"source": "app_store", "message": repr(exc)})
+        fetched = shared_sources(shared, args, now, start, end, dart_key)
+        for failure in fetched["failures"]:
+            log_failure(failures_path, now=now, **failure)
+        run_errors.extend(fetched["errors"])
 
+        appstore = fetched["appstore"]
+        raw_items.extend(appstore["items"])
         run_stats["sources"]["app_store"] = {
             "appsTotal": len(APPSTORE_APPS),
-            "fetchedOk": len(appstore_fetched),
-            "failed": len(appstore_failed),
+            "fetchedOk": len(appstore["fetched"]),
+            "failed": len(appstore["failed"]),
         }
 
         corp_map = {}
-        dart_filters = {"pblntf_ty": ["B", "E", "I"], "last_reprt_at": "Y"}
         if dart_key:
-            try:
-                corp_map, unmatched = build_corp_code_map(companies, dart_key)
+            if fetched["corpEntries"] is not None:
+                corp_map, unmatched = build_corp_code_map(
+                    companies, dart_key, corp_entries=fetched["corpEntries"]
+                )
                 write_unmatched(unmatched, archive_dir)
                 run_stats["sources"]["dart"] = {
                     "companiesTotal": len(companies),
                     "matched": len(corp_map),
                     "unmatched": len(unmatched),
-                    "filters": dart_filters,
+                    "filters": DART_FILTERS,
+                    **fetched["dartStats"],
                 }
-            except Exception as exc:
-                log_failure(failures_path, "dart", now, "DART fetch failed", detail=repr(exc))
-                run_errors.append({"source": "dart", "message": repr(exc)})
-                corp_map = {}
         else:
             log_failure(failures_path, "dart", now, "DART_API_KEY not set; skipping DART")
-            run_stats["sources"]["dart"] = {"skipped": True, "filters": dart_filters}
+            run_stats["sources"]["dart"] = {"skipped": True, "filters": DART_FILTERS}
 
-        for company, corp_code in corp_map.items():
-            entries = list_disclosures(
-                dart_key,
-                corp_code,
-                start,
-                end,
-                pblntf_ty=dart_filters["pblntf_ty"],
-                last_reprt_at=dart_filters["last_reprt_at"],
-            )
-            for entry in entries:
-                item = build_item(company, corp_code, entry)
-                if not item.get("date"):
-                    continue
-                raw_items.append(item)
+        for company in corp_map:
+            raw_items.extend(fetched["disclosures"].get(company, []))
 
         if "dart" in run_stats.get("sources", {}):
             run_stats["sources"]["dart"]["disclosuresFetched"] = len(
                 [item for item in raw_items if item.get("sourceType") == "dart"]
             )
 
-        try:
-            news_items, news_meta = build_news_items(companies, start, end)
+        if fetched["newsEntries"] is not None:
+            news_items, news_meta = build_news_items(
+                companies, start, end, entries=fetched["newsEntries"]
+            )
             raw_items.extend(news_items)
             run_stats["sources"]["news"] = {"rssLimit": 50, **news_meta}
-        except Exception as exc:
-            log_failure(failures_path, "news", now, "News fetch failed", detail=repr(exc))
-            run_errors.append({"source": "news", "message": repr(exc)})
 
         seen = {}
         for item in raw_items:
@@ -290,12 +333,14 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
         run_stats["filters"]["keywordPassed"] = keyword_passed
         run_stats["filters"]["candidates"] = len(candidates)
 
-        cache = load_cache(cache_path)
+        # The legacy cache.jsonl seeds a fresh store; it is no longer written.
+        cache = EnrichmentCache(dataset, legacy_path=archive_dir / "cache.jsonl")
+        cached_entries = cache.lookup_many(item["id"] for item in candidates)
         to_enrich = []
         enriched = {}
         cache_hit = 0
         for item in candidates:
-            cached = cache.get(item["id"])
+            cached = cached_entries.get(item["id"])
             if cached:
                 cache_hit += 1
                 enriched[item["id"]] = cached
@@ -318,7 +363,16 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
                 run_stats["llm"]["skippedNoKey"] = True
             else:
                 try:
-                    if dataset == "securities-updates":
+                    if args.llm_mode == "batch":
+                        enriched.update(
+                            enrich_items_offline(
+                                to_enrich,
+                                model=args.model,
+                                batch_size=args.batch_size,
+                                profile="updates" if dataset == "securities-updates" else "ai",
+                            )
+                        )
+                    elif dataset == "securities-updates":
                         enriched.update(
                             enrich_items_profile(
                                 to_enrich,
@@ -341,6 +395,7 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
             {
                 "cacheHit": cache_hit,
                 "sent": len(to_enrich) if openai_key else 0,
+                **llm_stats.snapshot(),
             }
         )
 
@@ -389,7 +444,7 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
             )
             cache_updates.append({"id": item["id"], **result})
 
-        append_cache(cache_updates, cache_path, archive_dir)
+        cache.store_many(cache_updates)
 
         events_by_month = {}
         for event in kept:
@@ -412,6 +467,8 @@ def run_dataset(args, now, start, end, dataset, *, openai_key, dart_key):
         run_errors.append({"message": repr(exc)})
         raise
     finally:
+        if cache is not None:
+            run_stats["cache"] = cache.close()
         try:
             write_run_and_history(run_path, run_history_path, run_stats, limit=7)
         except Exception:
@@ -426,6 +483,21 @@ def main():
     parser.add_argument("--month", type=str, default=None)
     parser.add_argument("--model", type=str, default="gpt-5-mini")
     parser.add_argument("--batch-size", type=int, default=12)
+    parser.add_argument(
+        "--llm-mode",
+        type=str,
+        default="sync",
+        choices=["sync", "batch"],
+        help="batch submits enrichment through the OpenAI Batch API (slower, cheaper).",
+    )
+    parser.add_argument(
+        "--dart-listing",
+        type=str,
+        default="corp",
+        choices=["corp", "market"],
+        help="market lists every DART filing once per type and filters by corp code "
+        "(fewer requests for long windows such as --month backfills).",
+    )
     args = parser.parse_args()
 
     import os
@@ -448,6 +520,17 @@ def main():
         else [args.dataset]
     )
 
+    companies_by_dataset = {
+        dataset: load_index_companies(dataset_dirs(dataset)[0]) for dataset in datasets
+    }
+    # Sources are fetched once per invocation for the union of companies.
+    shared = {
+        "companies": list(
+            dict.fromkeys(
+                company for companies in companies_by_dataset.values() for company in companies
+            )
+        )
+    }
     for dataset in datasets:
         run_dataset(
             args,
@@ -455,6 +538,8 @@ def main():
             start,
             end,
             dataset,
+            companies_by_dataset[dataset],
+            shared,
             openai_key=openai_key,
             dart_key=dart_key,
         )
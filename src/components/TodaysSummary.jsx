@@ -59,7 +59,17 @@ function TodaysSummary({ data, tab = 'ai', showTitle = true, compact = false })
                   rel={hasLink ? "noopener noreferrer" : undefined}
                   className={`news-card ${hasLink ? 'has-link' : ''}`}
                 >
-                  <div className="card-source">{card.source}</div>
+                  <div className="card-source">
+                    {card.source}
+                    {card.alternates?.length > 0 && (
+                      <span
+                        className="card-alternates"
+                        title={card.alternates.map((alt) => alt.source || alt.title).join(', ')}
+                      >
+                        {` 외 ${card.alternates.length}곳`}
+                      </span>
+                    )}
+                  </div>
                   {hasLink && (
                     <span className="external-icon" aria-hidden>
                       <svg width="14" height="14" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">